@@ -33,9 +33,12 @@ def list():
     table.add_column("Version", style="yellow")
     table.add_column("Location", style="blue")
 
-    for slicer in slicers:
-        status = "Installed" if slicer.is_valid() else "Not found"
-        status_style = "green" if slicer.is_valid() else "red"
+    # is_valid() stats the config files, so check each slicer once
+    valid = [slicer.is_valid() for slicer in slicers]
+
+    for slicer, is_valid in zip(slicers, valid):
+        status = "Installed" if is_valid else "Not found"
+        status_style = "green" if is_valid else "red"
         version = slicer.version or "Unknown"
         location = str(slicer.config_path)
 
@@ -43,7 +46,7 @@ def list():
 
     console.print(table)
 
-    installed_count = sum(1 for s in slicers if s.is_valid())
+    installed_count = sum(valid)
     console.print(f"\n[bold]Found {installed_count}/{len(slicers)} installed slicers[/bold]")
 
 
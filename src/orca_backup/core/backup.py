@@ -1,30 +1,60 @@
 """Backup creation functionality."""
 
+import errno
 import hashlib
-import json
+import mmap
+import os
 import platform
 import shutil
 import tempfile
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Optional
+from typing import List, Optional, Set
 
 from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerInfo
+from orca_backup.utils.buffers import get_buffer
 from orca_backup.utils.compression import compress_directory
-from orca_backup.utils.paths import ensure_directory, get_backup_name
+from orca_backup.utils.parallel import map_files
+from orca_backup.utils.paths import (
+    ensure_directory,
+    get_backup_name,
+    get_staging_root,
+    scandir_recursive,
+)
+
+# Read size for checksumming when hashlib.file_digest is unavailable
+HASH_CHUNK_SIZE = 8 * 1024 * 1024
+
+# Files at least this large are hashed through mmap
+MMAP_THRESHOLD = 16 * 1024 * 1024
+
+# Read size for copy_file_with_metadata's combined copy and checksum
+COPY_CHUNK_SIZE = 1024 * 1024
 
 
 def calculate_sha256(file_path: Path) -> str:
     """Calculate SHA256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+    if os.path.getsize(file_path) >= MMAP_THRESHOLD:
+        # Hash large files from a memory map in one call
+        with open(file_path, "rb") as f, mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+            return hashlib.sha256(mm).hexdigest()
+
+    with open(file_path, "rb", buffering=0) as f:
+        if hasattr(hashlib, "file_digest"):  # Python 3.11+
+            return hashlib.file_digest(f, "sha256").hexdigest()
 
+        sha256_hash = hashlib.sha256()
+        buffer = get_buffer(HASH_CHUNK_SIZE)
+        while n := f.readinto(buffer):
+            sha256_hash.update(buffer[:n])
+        return sha256_hash.hexdigest()
 
-def copy_file_with_metadata(src: Path, dst: Path, base_path: Path) -> FileEntry:
+
+def copy_file_with_metadata(
+    src: Path, dst: Path, base_path: Path, created_dirs: Optional[Set[Path]] = None
+) -> FileEntry:
     """
     Copy a file and create its metadata entry.
 
@@ -32,18 +62,41 @@ def copy_file_with_metadata(src: Path, dst: Path, base_path: Path) -> FileEntry:
         src: Source file path
         dst: Destination file path
         base_path: Base path for calculating relative paths
+        created_dirs: Directories already created by earlier calls; shared
+            across a batch of copies so each parent is only created once.
+            Safe to share between threads: a race at worst repeats an
+            exist_ok mkdir.
 
     Returns:
         FileEntry with file metadata
     """
-    dst.parent.mkdir(parents=True, exist_ok=True)
-    shutil.copy2(src, dst)
+    if created_dirs is None or dst.parent not in created_dirs:
+        dst.parent.mkdir(parents=True, exist_ok=True)
+        if created_dirs is not None:
+            created_dirs.add(dst.parent)
+
+    # Hash the data as it is copied so the source is only read once
+    sha256_hash = hashlib.sha256()
+    size = 0
+    buffer = get_buffer(COPY_CHUNK_SIZE)
+    with open(src, "rb", buffering=0) as fsrc, open(dst, "wb") as fdst:
+        while n := fsrc.readinto(buffer):
+            fdst.write(buffer[:n])
+            sha256_hash.update(buffer[:n])
+            size += n
+    shutil.copystat(src, dst)
 
     relative_path = str(src.relative_to(base_path))
-    size = src.stat().st_size
-    checksum = calculate_sha256(src)
+    return FileEntry.model_construct(path=relative_path, size=size, sha256=sha256_hash.hexdigest())
 
-    return FileEntry(path=relative_path, size=size, sha256=checksum)
+
+def _source_size(slicer: SlicerInfo) -> int:
+    """Return the total size in bytes of the files create_backup_staging will copy."""
+    total = slicer.conf_file.stat().st_size if slicer.conf_file else 0
+    for directory in (slicer.user_dir, slicer.custom_scripts_dir):
+        if directory and directory.exists():
+            total += sum(entry.stat().st_size for entry in scandir_recursive(directory))
+    return total
 
 
 def create_backup_staging(slicer: SlicerInfo, staging_dir: Path) -> List[FileEntry]:
@@ -59,37 +112,35 @@ def create_backup_staging(slicer: SlicerInfo, staging_dir: Path) -> List[FileEnt
     """
     file_entries: List[FileEntry] = []
     base_path = slicer.config_path
+    created_dirs = {staging_dir}
 
     # Copy main config file
     if slicer.conf_file:
         dst = staging_dir / slicer.conf_file.name
-        entry = copy_file_with_metadata(slicer.conf_file, dst, base_path)
+        entry = copy_file_with_metadata(slicer.conf_file, dst, base_path, created_dirs)
         file_entries.append(entry)
 
-    # Copy entire user directory
+    # Copy entire user directory, and custom_scripts if it exists
+    directories = []
     if slicer.user_dir:
-        user_dst = staging_dir / "user"
-        shutil.copytree(slicer.user_dir, user_dst, dirs_exist_ok=True)
-
-        # Create entries for all files in user directory
-        for file_path in slicer.user_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = str(file_path.relative_to(base_path))
-                size = file_path.stat().st_size
-                checksum = calculate_sha256(file_path)
-                file_entries.append(FileEntry(path=relative_path, size=size, sha256=checksum))
-
-    # Copy custom_scripts if it exists
+        directories.append((slicer.user_dir, staging_dir / "user"))
     if slicer.custom_scripts_dir and slicer.custom_scripts_dir.exists():
-        scripts_dst = staging_dir / "custom_scripts"
-        shutil.copytree(slicer.custom_scripts_dir, scripts_dst, dirs_exist_ok=True)
-
-        for file_path in slicer.custom_scripts_dir.rglob("*"):
-            if file_path.is_file():
-                relative_path = str(file_path.relative_to(base_path))
-                size = file_path.stat().st_size
-                checksum = calculate_sha256(file_path)
-                file_entries.append(FileEntry(path=relative_path, size=size, sha256=checksum))
+        directories.append((slicer.custom_scripts_dir, staging_dir / "custom_scripts"))
+
+    sources: List[Path] = []
+    destinations: List[Path] = []
+    total_size = 0
+    for src_dir, dst_dir in directories:
+        for entry in scandir_recursive(src_dir):
+            file_path = Path(entry.path)
+            sources.append(file_path)
+            destinations.append(dst_dir / file_path.relative_to(src_dir))
+            total_size += entry.stat().st_size
+
+    # Each file is read once, copied and hashed together, so a file's size
+    # and checksum describe the same bytes
+    copy = partial(copy_file_with_metadata, base_path=base_path, created_dirs=created_dirs)
+    file_entries.extend(map_files(copy, sources, destinations, total_size=total_size))
 
     return file_entries
 
@@ -103,7 +154,7 @@ def create_manifest(
     return BackupManifest(
         version="1.0",
         created_at=datetime.now(),
-        slicer=slicer.name,  # Already a string due to use_enum_values
+        slicer=slicer.name,  # Already a string (SlicerName)
         slicer_version=slicer.version,
         platform=platform.system().lower(),
         files=file_entries,
@@ -118,6 +169,7 @@ def create_backup(
     output_dir: Path,
     compress: bool = True,
     verify: bool = True,
+    compresslevel: int = 1,
 ) -> Path:
     """
     Create a backup of a slicer configuration.
@@ -127,6 +179,8 @@ def create_backup(
         output_dir: Directory to save backup
         compress: Whether to compress the backup (default: True)
         verify: Whether to verify the backup (default: True)
+        compresslevel: DEFLATE level 0-9 for compressed backups (default: 1,
+            much faster than zlib's 6 and nearly as small for config files)
 
     Returns:
         Path to created backup file/directory
@@ -140,8 +194,9 @@ def create_backup(
 
     ensure_directory(output_dir)
 
-    # Create temporary staging directory
-    with tempfile.TemporaryDirectory() as temp_dir:
+    # Create temporary staging directory (in RAM when it has room for the files)
+    staging_root = get_staging_root(_source_size(slicer))
+    with tempfile.TemporaryDirectory(dir=staging_root) as temp_dir:
         staging_dir = Path(temp_dir) / "backup"
         staging_dir.mkdir()
 
@@ -153,8 +208,7 @@ def create_backup(
 
         # Write manifest to staging directory
         manifest_path = staging_dir / "backup_manifest.json"
-        with open(manifest_path, "w", encoding="utf-8") as f:
-            json.dump(manifest.model_dump(mode="json"), f, indent=2, default=str)
+        manifest_path.write_text(manifest.model_dump_json(indent=2), encoding="utf-8")
 
         # Generate output filename
         backup_name = get_backup_name(slicer.name, manifest.created_at, compress)  # name is already a string
@@ -162,15 +216,25 @@ def create_backup(
 
         if compress:
             # Compress to ZIP
-            compress_directory(staging_dir, output_path)
+            compress_directory(staging_dir, output_path, compresslevel=compresslevel)
         else:
-            # Copy directory
-            shutil.copytree(staging_dir, output_path)
+            # Move the staged directory into place with a rename, or copy it
+            # when the staging directory is on another filesystem (tmpfs).
+            # Never merge into an existing backup of the same name.
+            if output_path.exists():
+                raise FileExistsError(f"Backup already exists: {output_path}")
+            try:
+                os.rename(staging_dir, output_path)
+            except OSError as e:
+                if e.errno != errno.EXDEV:
+                    raise
+                shutil.copytree(staging_dir, output_path)
 
     if verify:
         from orca_backup.core.verify import verify_backup
 
-        if not verify_backup(output_path):
+        # Checksums were just computed from the staged files, so skip re-hashing
+        if not verify_backup(output_path, fast=True):
             raise RuntimeError("Backup verification failed")
 
     return output_path
@@ -1,6 +1,7 @@
 """Slicer detection functionality."""
 
 import json
+import os
 import platform
 import re
 from pathlib import Path
@@ -8,40 +9,64 @@ from typing import Dict, List, Optional
 
 from orca_backup.models.slicer import SlicerInfo, SlicerType
 
+try:  # faster JSON parsing, installed with the "fast" extra
+    from orjson import loads as _json_loads
+except ImportError:
+    _json_loads = json.loads
+
+# How much of a config file to scan for the version header before reading it all
+VERSION_SCAN_BYTES = 8192
+
+# Version number such as "2.3.1" or "2.3.1-beta"
+VERSION_RE = re.compile(r"(\d+\.\d+\.\d+(?:-\w+)?)")
+
+# The same version inside a raw "header" entry, e.g. "header": "OrcaSlicer 2.3.1-beta"
+HEADER_VERSION_RE = re.compile(rb'"header"\s*:\s*"[^"]*?(\d+\.\d+\.\d+(?:-\w+)?)')
+
+# A plain "version" string directly inside a flat "app" object
+APP_VERSION_RE = re.compile(rb'"app"\s*:\s*\{[^{}]*?"version"\s*:\s*"([^"\\]*)"')
+
+DISPLAY_NAMES = {
+    SlicerType.ORCASLICER: "OrcaSlicer",
+    SlicerType.ORCA_FLASHFORGE: "Orca-Flashforge",
+}
+
+CONF_FILENAMES = {
+    SlicerType.ORCASLICER: "OrcaSlicer.conf",
+    SlicerType.ORCA_FLASHFORGE: "Orca-Flashforge.conf",
+}
+
 
 def get_slicer_paths() -> Dict[str, Dict[str, Path]]:
     """Get platform-specific slicer config directory paths."""
     system = platform.system().lower()
+    home = Path.home()
+    # joinpath with several parts parses and builds one Path, where each '/' builds another
 
     if system == "windows":
-        base = Path.home() / "AppData" / "Roaming"
+        base = home.joinpath("AppData", "Roaming")
         return {
             "orcaslicer": base / "OrcaSlicer",
             "orca-flashforge": base / "Orca-Flashforge",
         }
     elif system == "darwin":  # macOS
-        base = Path.home() / "Library" / "Application Support"
+        base = home.joinpath("Library", "Application Support")
         return {
             "orcaslicer": base / "OrcaSlicer",
             "orca-flashforge": base / "Orca-Flashforge",
         }
     elif system == "linux":
         # Check for Flatpak first
-        flatpak_path = (
-            Path.home()
-            / ".var"
-            / "app"
-            / "io.github.softfever.OrcaSlicer"
-            / "config"
-            / "OrcaSlicer"
+        flatpak_path = home.joinpath(
+            ".var", "app", "io.github.softfever.OrcaSlicer", "config", "OrcaSlicer"
         )
         if flatpak_path.exists():
             return {
                 "orcaslicer": flatpak_path,
-                "orca-flashforge": Path.home() / ".config" / "Orca-Flashforge",
+                "orca-flashforge": home / ".config" / "Orca-Flashforge",
             }
         # Standard Linux paths
-        base = Path.home() / ".config"
+        base = home / ".config"
         return {
             "orcaslicer": base / "OrcaSlicer",
             "orca-flashforge": base / "Orca-Flashforge",
@@ -53,18 +78,30 @@ def get_slicer_paths() -> Dict[str, Dict[str, Path]]:
 def extract_version(conf_file: Path) -> Optional[str]:
     """Extract slicer version from config file."""
     try:
-        with open(conf_file, "r", encoding="utf-8") as f:
-            content = f.read()
-            # Try to parse as JSON
-            if content.strip().startswith("{"):
-                data = json.loads(content.split("# MD5")[0])  # Remove checksum line
-                if "header" in data:
-                    # Extract version from header like "OrcaSlicer 2.3.1-beta"
-                    match = re.search(r"(\d+\.\d+\.\d+(?:-\w+)?)", data["header"])
-                    if match:
-                        return match.group(1)
-                if "app" in data and "version" in data["app"]:
-                    return data["app"]["version"]
+        with open(conf_file, "rb") as f:
+            head = f.read(VERSION_SCAN_BYTES)
+            if not head.lstrip().startswith(b"{"):
+                return None
+            # The header is normally the first key, so look for it before reading on
+            match = HEADER_VERSION_RE.search(head)
+            if match:
+                return match.group(1).decode()
+            content = head + f.read()
+
+        # Pick the fields out of the raw bytes; only parse the JSON if that fails
+        match = HEADER_VERSION_RE.search(content) or APP_VERSION_RE.search(content)
+        if match:
+            return match.group(1).decode()
+
+        # Bytes go straight to the parser, no decode
+        data = _json_loads(content.split(b"# MD5")[0])  # Remove checksum line
+        if "header" in data:
+            # Extract version from header like "OrcaSlicer 2.3.1-beta"
+            match = VERSION_RE.search(data["header"])
+            if match:
+                return match.group(1)
+        if "app" in data and "version" in data["app"]:
+            return data["app"]["version"]
     except Exception:
         pass
     return None
@@ -75,47 +112,40 @@ def get_slicer_info(slicer_type: SlicerType) -> SlicerInfo:
     paths = get_slicer_paths()
     config_path = paths[slicer_type.value]
 
-    display_names = {
-        SlicerType.ORCASLICER: "OrcaSlicer",
-        SlicerType.ORCA_FLASHFORGE: "Orca-Flashforge",
-    }
-
-    conf_filenames = {
-        SlicerType.ORCASLICER: "OrcaSlicer.conf",
-        SlicerType.ORCA_FLASHFORGE: "Orca-Flashforge.conf",
-    }
-
-    exists = config_path.exists()
-    conf_file = config_path / conf_filenames[slicer_type] if exists else None
-    user_dir = config_path / "user" if exists else None
-    custom_scripts_dir = config_path / "custom_scripts" if exists else None
-
+    # One directory listing answers every existence check below
+    try:
+        with os.scandir(config_path) as entries:
+            children = {entry.name for entry in entries}
+        exists = True
+    except OSError:
+        children = set()
+        exists = config_path.exists()
+
+    conf_name = CONF_FILENAMES[slicer_type]
+    conf_file = config_path / conf_name if conf_name in children else None
+    user_dir = config_path / "user" if "user" in children else None
     # Only include custom_scripts if it actually exists
-    if custom_scripts_dir and not custom_scripts_dir.exists():
-        custom_scripts_dir = None
+    custom_scripts_dir = config_path / "custom_scripts" if "custom_scripts" in children else None
 
     version = None
-    if conf_file and conf_file.exists():
+    if conf_file:
         version = extract_version(conf_file)
 
     return SlicerInfo(
         name=slicer_type,
-        display_name=display_names[slicer_type],
+        display_name=DISPLAY_NAMES[slicer_type],
         config_path=config_path,
         exists=exists,
         version=version,
-        conf_file=conf_file if conf_file and conf_file.exists() else None,
-        user_dir=user_dir if user_dir and user_dir.exists() else None,
+        conf_file=conf_file,
+        user_dir=user_dir,
         custom_scripts_dir=custom_scripts_dir,
     )
 
 
 def detect_slicers() -> List[SlicerInfo]:
     """Detect all installed slicers."""
-    return [
-        get_slicer_info(SlicerType.ORCASLICER),
-        get_slicer_info(SlicerType.ORCA_FLASHFORGE),
-    ]
+    return [get_slicer_info(slicer_type) for slicer_type in SlicerType]
 
 
 def get_installed_slicers() -> List[SlicerInfo]:
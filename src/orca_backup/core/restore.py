@@ -1,16 +1,18 @@
 """Backup restore functionality."""
 
 import shutil
-import tempfile
+import zipfile
 from datetime import datetime
+from functools import partial
 from pathlib import Path
-from typing import List, Tuple
+from typing import Callable, Dict, List, Tuple
 
-from orca_backup.core.backup import create_backup
+from orca_backup.core.backup import COPY_CHUNK_SIZE, calculate_sha256, create_backup
 from orca_backup.core.detector import get_slicer_info
 from orca_backup.core.verify import load_manifest, verify_backup
+from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerInfo, SlicerType
-from orca_backup.utils.compression import extract_archive
+from orca_backup.utils.parallel import map_files
 
 
 def get_restore_file_list(backup_path: Path) -> List[Tuple[Path, Path]]:
@@ -40,6 +42,83 @@ def get_restore_file_list(backup_path: Path) -> List[Tuple[Path, Path]]:
     return file_list
 
 
+def _matches_entry(dst: Path, entry: FileEntry) -> bool:
+    """Check whether dst already holds the manifest entry's data (same size and SHA256)."""
+    try:
+        if dst.stat().st_size != entry.size:
+            return False
+        return calculate_sha256(dst) == entry.sha256
+    except OSError:
+        return False
+
+
+def _restore_if_changed(
+    restore_file: Callable[[Path, Path], bool],
+    entries: Dict[Path, FileEntry],
+    src_rel: Path,
+    dst: Path,
+) -> bool:
+    """Restore one file unless dst already matches its manifest entry."""
+    # Leave files that already match untouched, so repeated restores only
+    # write what changed
+    entry = entries.get(src_rel)
+    if entry is not None and _matches_entry(dst, entry):
+        return True
+    return restore_file(src_rel, dst)
+
+
+def _restore_from_zip(zipf: zipfile.ZipFile, src_rel: Path, dst: Path) -> bool:
+    """Write one archive member to dst without extracting the archive first."""
+    try:
+        info = zipf.getinfo(src_rel.as_posix())
+    except KeyError:
+        print(f"WARNING: File not found in backup: {src_rel}")
+        return False
+
+    # Create parent directory
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    try:
+        with zipf.open(info) as fsrc, open(dst, "wb") as fdst:
+            shutil.copyfileobj(fsrc, fdst, COPY_CHUNK_SIZE)
+        return True
+    except Exception as e:
+        print(f"WARNING: Failed to restore {src_rel}: {e}")
+        return False
+
+
+def _restore_from_dir(source_dir: Path, src_rel: Path, dst: Path) -> bool:
+    """Copy one file from an uncompressed backup to dst."""
+    src = source_dir / src_rel
+    if not src.exists():
+        print(f"WARNING: File not found in backup: {src_rel}")
+        return False
+
+    # Create parent directory
+    dst.parent.mkdir(parents=True, exist_ok=True)
+
+    # Copy file
+    try:
+        shutil.copy2(src, dst)
+        return True
+    except Exception as e:
+        print(f"WARNING: Failed to restore {src_rel}: {e}")
+        return False
+
+
+def _restore_files(
+    file_list: List[Tuple[Path, Path]],
+    restore_file: Callable[[Path, Path], bool],
+    manifest: BackupManifest,
+) -> int:
+    """Restore the files that differ from the manifest; returns how many succeeded."""
+    entries = {Path(entry.path): entry for entry in manifest.files}
+    restore_changed = partial(_restore_if_changed, restore_file, entries)
+    sources = [src for src, _ in file_list]
+    destinations = [dst for _, dst in file_list]
+    return sum(map_files(restore_changed, sources, destinations, total_size=manifest.total_size))
+
+
 def restore_backup(
     backup_path: Path,
     slicer_type: SlicerType = None,
@@ -101,33 +180,13 @@ def restore_backup(
         except Exception as e:
             raise RuntimeError(f"Failed to backup existing configuration: {e}")
 
-    # Extract backup to temp directory
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        if backup_path.is_file() and backup_path.suffix == ".zip":
-            extract_archive(backup_path, temp_path)
-            source_dir = temp_path
-        else:
-            source_dir = backup_path
-
-        # Copy files to destination
-        restored_count = 0
-        for src_rel, dst in file_list:
-            src = source_dir / src_rel
-            if not src.exists():
-                print(f"WARNING: File not found in backup: {src_rel}")
-                continue
-
-            # Create parent directory
-            dst.parent.mkdir(parents=True, exist_ok=True)
-
-            # Copy file
-            try:
-                shutil.copy2(src, dst)
-                restored_count += 1
-            except Exception as e:
-                print(f"WARNING: Failed to restore {src_rel}: {e}")
+    # Copy files to destination, streaming straight out of the ZIP if compressed
+    if backup_path.is_file() and backup_path.suffix == ".zip":
+        with zipfile.ZipFile(backup_path, "r") as zipf:
+            restored_count = _restore_files(file_list, partial(_restore_from_zip, zipf), manifest)
+    else:
+        restore_file = partial(_restore_from_dir, backup_path)
+        restored_count = _restore_files(file_list, restore_file, manifest)
 
     print(f"Restored {restored_count}/{len(file_list)} files")
     return restored_count == len(file_list)
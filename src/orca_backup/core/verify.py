@@ -1,54 +1,105 @@
 """Backup verification functionality."""
 
-import hashlib
-import json
 import tempfile
 import zipfile
+import zlib
 from pathlib import Path
-from typing import Optional, Tuple
+from typing import List, Optional, Tuple
 
+from orca_backup.core.backup import calculate_sha256
 from orca_backup.models.backup import BackupInfo, BackupManifest
 from orca_backup.utils.compression import extract_archive, is_valid_zip
-
-
-def calculate_sha256(file_path: Path) -> str:
-    """Calculate SHA256 checksum of a file."""
-    sha256_hash = hashlib.sha256()
-    with open(file_path, "rb") as f:
-        for byte_block in iter(lambda: f.read(4096), b""):
-            sha256_hash.update(byte_block)
-    return sha256_hash.hexdigest()
+from orca_backup.utils.parallel import map_files
+from orca_backup.utils.paths import scandir_recursive
 
 
 def load_manifest(backup_path: Path) -> Optional[BackupManifest]:
     """Load backup manifest from a backup file or directory."""
+    # model_validate_json parses and validates the raw bytes in one pass in
+    # pydantic-core, with no intermediate dict
     try:
         if backup_path.is_file() and backup_path.suffix == ".zip":
             # Extract manifest from ZIP
             with zipfile.ZipFile(backup_path, "r") as zipf:
-                with zipf.open("backup_manifest.json") as f:
-                    data = json.load(f)
-                    return BackupManifest(**data)
+                return BackupManifest.model_validate_json(zipf.read("backup_manifest.json"))
         elif backup_path.is_dir():
             # Load manifest from directory
             manifest_path = backup_path / "backup_manifest.json"
             if manifest_path.exists():
-                with open(manifest_path, "r", encoding="utf-8") as f:
-                    data = json.load(f)
-                    return BackupManifest(**data)
+                return BackupManifest.model_validate_json(manifest_path.read_bytes())
     except Exception:
         return None
 
     return None
 
 
-def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
+def _find_bad_files(check_dir: Path, manifest: BackupManifest) -> Tuple[List[str], List[str]]:
+    """Return manifest paths that are missing or fail their checksum under check_dir."""
+    missing_files = []
+    mismatches = []
+    present_entries = []
+    for file_entry in manifest.files:
+        try:
+            size = (check_dir / file_entry.path).stat().st_size
+        except OSError:
+            missing_files.append(file_entry.path)
+            continue
+        # A file of the wrong size cannot match its checksum, so skip hashing it
+        if size != file_entry.size:
+            mismatches.append(file_entry.path)
+        else:
+            present_entries.append(file_entry)
+
+    actual_checksums = map_files(
+        calculate_sha256,
+        [check_dir / entry.path for entry in present_entries],
+        total_size=sum(entry.size for entry in present_entries),
+    )
+    mismatches.extend(
+        entry.path
+        for entry, actual_checksum in zip(present_entries, actual_checksums)
+        if actual_checksum != entry.sha256
+    )
+
+    return missing_files, mismatches
+
+
+def _find_bad_sizes(
+    backup_path: Path, manifest: BackupManifest, is_compressed: bool
+) -> Tuple[List[str], List[str]]:
+    """Return manifest paths that are missing or have the wrong size, without reading file data."""
+    if is_compressed:
+        with zipfile.ZipFile(backup_path, "r") as zipf:
+            archive_sizes = {info.filename: info.file_size for info in zipf.infolist()}
+
+    missing_files = []
+    size_mismatches = []
+
+    for file_entry in manifest.files:
+        if is_compressed:
+            size = archive_sizes.get(Path(file_entry.path).as_posix())
+        else:
+            file_path = backup_path / file_entry.path
+            size = file_path.stat().st_size if file_path.is_file() else None
+
+        if size is None:
+            missing_files.append(file_entry.path)
+        elif size != file_entry.size:
+            size_mismatches.append(file_entry.path)
+
+    return missing_files, size_mismatches
+
+
+def verify_backup(backup_path: Path, verbose: bool = False, fast: bool = False) -> bool:
     """
     Verify the integrity of a backup.
 
     Args:
         backup_path: Path to backup file or directory
         verbose: Whether to print detailed verification info
+        fast: Check file presence and sizes instead of re-hashing every file.
+            Only suitable right after the backup was written from freshly
+            checksummed files (ZIP members are still CRC-checked).
 
     Returns:
         True if backup is valid, False otherwise
@@ -58,10 +109,11 @@ def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
             print(f"ERROR: Backup not found: {backup_path}")
         return False
 
-    # Check if it's a valid ZIP
+    # Check if it's a valid ZIP. A full check extracts every member below,
+    # which verifies the CRCs anyway, so only the fast check decompresses here.
     is_compressed = backup_path.is_file() and backup_path.suffix == ".zip"
     if is_compressed:
-        if not is_valid_zip(backup_path):
+        if not is_valid_zip(backup_path, deep=fast):
             if verbose:
                 print("ERROR: Invalid or corrupted ZIP file")
             return False
@@ -78,49 +130,42 @@ def verify_backup(backup_path: Path, verbose: bool = False) -> bool:
     if verbose:
         print("Manifest file found and valid")
 
-    # Verify files and checksums
-    with tempfile.TemporaryDirectory() as temp_dir:
-        temp_path = Path(temp_dir)
-
-        if is_compressed:
-            # Extract to temp directory
-            extract_archive(backup_path, temp_path)
-            check_dir = temp_path
-        else:
-            check_dir = backup_path
-
-        # Verify all files exist and checksums match
-        missing_files = []
-        checksum_mismatches = []
-
-        for file_entry in manifest.files:
-            file_path = check_dir / file_entry.path
-            if not file_path.exists():
-                missing_files.append(file_entry.path)
-                continue
-
-            actual_checksum = calculate_sha256(file_path)
-            if actual_checksum != file_entry.sha256:
-                checksum_mismatches.append(file_entry.path)
-
-        if missing_files:
-            if verbose:
-                print(f"ERROR: Missing files: {len(missing_files)}")
-                for f in missing_files[:5]:  # Show first 5
-                    print(f"  - {f}")
-            return False
+    # Verify all files exist and checksums (or sizes) match
+    if fast:
+        missing_files, mismatches = _find_bad_sizes(backup_path, manifest, is_compressed)
+    elif is_compressed:
+        # Extract to temp directory
+        with tempfile.TemporaryDirectory() as temp_dir:
+            temp_path = Path(temp_dir)
+            try:
+                extract_archive(backup_path, temp_path)
+            except (zipfile.BadZipFile, zlib.error):
+                if verbose:
+                    print("ERROR: Invalid or corrupted ZIP file")
+                return False
+            missing_files, mismatches = _find_bad_files(temp_path, manifest)
+    else:
+        missing_files, mismatches = _find_bad_files(backup_path, manifest)
 
-        if checksum_mismatches:
-            if verbose:
-                print(f"ERROR: Checksum mismatches: {len(checksum_mismatches)}")
-                for f in checksum_mismatches[:5]:  # Show first 5
-                    print(f"  - {f}")
-            return False
+    if missing_files:
+        if verbose:
+            print(f"ERROR: Missing files: {len(missing_files)}")
+            for f in missing_files[:5]:  # Show first 5
+                print(f"  - {f}")
+        return False
 
+    if mismatches:
         if verbose:
-            print(f"All {manifest.total_files} files present")
-            print("All checksums verified")
-            print("Backup is valid and complete")
+            kind = "Size" if fast else "Checksum"
+            print(f"ERROR: {kind} mismatches: {len(mismatches)}")
+            for f in mismatches[:5]:  # Show first 5
+                print(f"  - {f}")
+        return False
+
+    if verbose:
+        print(f"All {manifest.total_files} files present")
+        print("All file sizes verified" if fast else "All checksums verified")
+        print("Backup is valid and complete")
 
     return True
 
@@ -136,7 +181,8 @@ def get_backup_info(backup_path: Path) -> Optional[BackupInfo]:
     if backup_path.is_file():
         size_mb = backup_path.stat().st_size / (1024 * 1024)
     else:
-        total_size = sum(f.stat().st_size for f in backup_path.rglob("*") if f.is_file())
+        # One scandir walk; file types come from the listing, not a stat per entry
+        total_size = sum(entry.stat().st_size for entry in scandir_recursive(backup_path))
         size_mb = total_size / (1024 * 1024)
 
     return BackupInfo(
@@ -2,7 +2,7 @@
 
 from enum import Enum
 from pathlib import Path
-from typing import Optional
+from typing import Literal, Optional
 
 from pydantic import BaseModel, Field
 
@@ -14,10 +14,16 @@ class SlicerType(str, Enum):
     ORCA_FLASHFORGE = "orca-flashforge"
 
 
+# SlicerType's values, for model fields: pydantic checks a Literal with a
+# plain string comparison and stores a str, where an Enum field goes
+# through enum lookup and conversion. SlicerType members are accepted too.
+SlicerName = Literal["orcaslicer", "orca-flashforge"]
+
+
 class SlicerInfo(BaseModel):
     """Information about a detected slicer installation."""
 
-    name: SlicerType = Field(..., description="Slicer type identifier")
+    name: SlicerName = Field(..., description="Slicer type identifier")
     display_name: str = Field(..., description="Human-readable slicer name")
     config_path: Path = Field(..., description="Path to slicer config directory")
     exists: bool = Field(..., description="Whether the slicer is installed")
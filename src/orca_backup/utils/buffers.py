@@ -0,0 +1,14 @@
+"""Reusable per-thread I/O buffers."""
+
+import threading
+
+# Per-thread read buffers, reused across files and archive members
+_buffers = threading.local()
+
+
+def get_buffer(size: int) -> memoryview:
+    """Return this thread's reusable read buffer, at least size bytes long."""
+    buffer = getattr(_buffers, "buffer", None)
+    if buffer is None or len(buffer) < size:
+        buffer = _buffers.buffer = memoryview(bytearray(size))
+    return buffer
@@ -1,11 +1,66 @@
 """Compression and archiving utilities."""
 
+import os
+import struct
 import zipfile
+import zlib
+from functools import partial
 from pathlib import Path
-from typing import List
+from typing import List, Optional
 
+from orca_backup.utils.buffers import get_buffer
+from orca_backup.utils.parallel import map_files
+from orca_backup.utils.paths import scandir_recursive
 
-def compress_directory(source_dir: Path, output_file: Path, exclude_patterns: List[str] = None) -> Path:
+try:  # libdeflate bindings, installed with the "fast" extra
+    import deflate
+except ImportError:
+    deflate = None
+
+# libdeflate's CRC-32 uses carry-less multiply (PCLMULQDQ) where available
+_crc32 = getattr(deflate, "crc32", None) or zlib.crc32
+
+# Raised by _inflate_raw for a corrupt stream
+_INFLATE_ERRORS = (zlib.error,) if deflate is None else (zlib.error, deflate.DeflateError)
+
+# Magic bytes at the start of every ZIP local file header, and its fixed size
+LOCAL_HEADER_SIGNATURE = b"PK\x03\x04"
+LOCAL_HEADER_SIZE = 30
+
+# Already-compressed formats; deflating them again costs time for no gain
+STORED_SUFFIXES = {
+    ".3mf",
+    ".7z",
+    ".bz2",
+    ".gz",
+    ".jpeg",
+    ".jpg",
+    ".png",
+    ".webp",
+    ".xz",
+    ".zip",
+    ".zst",
+}
+
+# Members up to this size are extracted in memory; larger ones are streamed
+IN_MEMORY_EXTRACT_MAX = 16 * 1024 * 1024
+
+# Write buffer for the output archive
+OUTPUT_BUFFER_SIZE = 1024 * 1024
+
+# Read size when streaming large members out of an archive
+EXTRACT_CHUNK_SIZE = 1024 * 1024
+
+# Characters ZipFile.extract replaces in member names on Windows
+WINDOWS_ILLEGAL_CHARS = str.maketrans(':<>|"?*', "_" * 7)
+
+
+def compress_directory(
+    source_dir: Path,
+    output_file: Path,
+    exclude_patterns: List[str] = None,
+    compresslevel: Optional[int] = None,
+) -> Path:
     """
     Compress a directory to a ZIP file.
 
@@ -13,6 +68,8 @@ def compress_directory(source_dir: Path, output_file: Path, exclude_patterns: Li
         source_dir: Directory to compress
         output_file: Output ZIP file path
         exclude_patterns: List of patterns to exclude (not implemented yet)
+        compresslevel: DEFLATE level 0-9 (None uses zlib's default); 0 stores
+            every member uncompressed without running the deflate step at all.
 
     Returns:
         Path to created ZIP file
@@ -20,15 +77,116 @@ def compress_directory(source_dir: Path, output_file: Path, exclude_patterns: Li
     if exclude_patterns is None:
         exclude_patterns = []
 
-    with zipfile.ZipFile(output_file, "w", zipfile.ZIP_DEFLATED) as zipf:
-        for file_path in source_dir.rglob("*"):
-            if file_path.is_file():
-                arcname = file_path.relative_to(source_dir)
-                zipf.write(file_path, arcname)
+    # A large write buffer batches each member's header and payload writes
+    with open(output_file, "wb", buffering=OUTPUT_BUFFER_SIZE) as output:
+        with zipfile.ZipFile(
+            output, "w", zipfile.ZIP_DEFLATED, compresslevel=compresslevel
+        ) as zipf:
+            for entry in scandir_recursive(source_dir):
+                arcname = os.path.relpath(entry.path, source_dir)
+                if compresslevel == 0 or os.path.splitext(entry.name)[1].lower() in STORED_SUFFIXES:
+                    zipf.write(entry.path, arcname, compress_type=zipfile.ZIP_STORED)
+                else:
+                    zipf.write(entry.path, arcname)
 
     return output_file
 
 
+def _member_target(output_dir: Path, filename: str, check_links: bool) -> Path:
+    """
+    Map an archive member name to a path inside output_dir.
+
+    The name is sanitized the way ZipFile.extract does it: both separators
+    are honoured and drive letters, '.', '..' and empty parts are dropped.
+    With check_links (output_dir already had contents, which may include
+    symlinks), output_dir must be resolved, and a target that still resolves
+    outside it raises BadZipFile.
+    """
+    name = filename.replace("/", os.sep)
+    if os.altsep:
+        name = name.replace(os.altsep, os.sep)
+    name = os.path.splitdrive(name)[1]
+    parts = [part for part in name.split(os.sep) if part not in ("", os.curdir, os.pardir)]
+    if os.sep == "\\":
+        parts = [part.translate(WINDOWS_ILLEGAL_CHARS).rstrip(".") for part in parts]
+        parts = [part for part in parts if part]
+
+    target = output_dir.joinpath(*parts)
+    if check_links and not target.resolve().is_relative_to(output_dir):
+        raise zipfile.BadZipFile(f"Member {filename!r} would extract outside {output_dir}")
+    return target
+
+
+def _member_data_offset(archive_fd: int, info: zipfile.ZipInfo) -> int:
+    """Return the offset of a member's data, read from its local header."""
+    # The local header's name and extra lengths can differ from the central
+    # directory's. pread leaves the shared descriptor's position alone.
+    header = os.pread(archive_fd, LOCAL_HEADER_SIZE, info.header_offset)
+    if header[:4] != LOCAL_HEADER_SIGNATURE:
+        raise zipfile.BadZipFile(f"Bad local header for {info.filename}")
+    name_length, extra_length = struct.unpack("<HH", header[26:30])
+    return info.header_offset + LOCAL_HEADER_SIZE + name_length + extra_length
+
+
+def _inflate_raw(data: bytes, size: int) -> bytes:
+    """Decompress a raw DEFLATE stream of known output size in one call, never past size."""
+    if deflate is not None:
+        # libdeflate fails rather than write more than size bytes
+        return deflate.deflate_decompress(data, size)
+
+    # Stop one byte past the declared size, so a bomb is caught without inflating it
+    decompressor = zlib.decompressobj(-zlib.MAX_WBITS)
+    output = decompressor.decompress(data, size + 1)
+    if len(output) > size or decompressor.unconsumed_tail:
+        raise zlib.error(f"Data inflates past the declared size of {size} bytes")
+    return output
+
+
+def _read_member(archive_fd: int, info: zipfile.ZipInfo, target: Path) -> None:
+    """Read a stored or deflated member into memory in one shot, check its CRC and write it."""
+    offset = _member_data_offset(archive_fd, info)
+    data = os.pread(archive_fd, info.compress_size, offset)
+    if len(data) != info.compress_size:
+        raise zipfile.BadZipFile(f"Truncated data for {info.filename}")
+
+    if info.compress_type == zipfile.ZIP_DEFLATED:
+        try:
+            data = _inflate_raw(data, info.file_size)
+        except _INFLATE_ERRORS as e:
+            raise zipfile.BadZipFile(f"Corrupt data for {info.filename}: {e}") from e
+    if len(data) != info.file_size or _crc32(data) != info.CRC:
+        raise zipfile.BadZipFile(f"Bad CRC-32 for file {info.filename!r}")
+    with open(target, "wb") as output:
+        output.write(data)
+
+
+def _extract_member(
+    zipf: zipfile.ZipFile, archive_fd: int, info: zipfile.ZipInfo, target: Path
+) -> None:
+    """
+    Extract one file member to target.
+
+    Safe to call from several threads on the same ZipFile. The target's
+    parent directory must already exist.
+    """
+    # Small members are read whole, with no per-member decompressor object
+    # or chunked reads (os.pread is Unix-only)
+    if (
+        info.compress_type in (zipfile.ZIP_STORED, zipfile.ZIP_DEFLATED)
+        and not info.flag_bits & 0x1  # encrypted
+        and max(info.file_size, info.compress_size) <= IN_MEMORY_EXTRACT_MAX
+        and hasattr(os, "pread")
+    ):
+        _read_member(archive_fd, info, target)
+        return
+
+    # Large or unusual members stream through zipfile into the thread's buffer
+    buffer = get_buffer(EXTRACT_CHUNK_SIZE)
+    with zipf.open(info) as source, open(target, "wb") as output:
+        while n := source.readinto(buffer):
+            output.write(buffer[:n])
+
+
 def extract_archive(archive_path: Path, output_dir: Path) -> Path:
     """
     Extract a ZIP archive to a directory.
@@ -41,17 +199,65 @@ def extract_archive(archive_path: Path, output_dir: Path) -> Path:
         Path to extraction directory
     """
     output_dir.mkdir(parents=True, exist_ok=True)
+    root = output_dir.resolve()
+
+    # Extraction never creates symlinks, so targets only need resolving when
+    # something was already in output_dir
+    with os.scandir(root) as entries:
+        check_links = any(True for _ in entries)
+
+    with zipfile.ZipFile(archive_path, "r") as zipf, open(archive_path, "rb") as archive:
+        # Every target is checked before anything is written
+        members = []
+        directories = set()
+        for info in zipf.infolist():
+            target = _member_target(root, info.filename, check_links)
+            if info.is_dir():
+                directories.add(target)
+            else:
+                members.append((info, target))
+                directories.add(target.parent)
 
-    with zipfile.ZipFile(archive_path, "r") as zipf:
-        zipf.extractall(output_dir)
+        # Create each directory once up front instead of once per member;
+        # parents sort before their children, so no makedirs repeats their work
+        for directory in sorted(directories):
+            directory.mkdir(parents=True, exist_ok=True)
+
+        extract = partial(_extract_member, zipf, archive.fileno())
+
+        # ZipFile supports concurrent reads of different members
+        infos = [info for info, _ in members]
+        targets = [target for _, target in members]
+        map_files(extract, infos, targets, total_size=sum(info.file_size for info in infos))
 
     return output_dir
 
 
-def is_valid_zip(archive_path: Path) -> bool:
-    """Check if a file is a valid ZIP archive."""
+def is_valid_zip(archive_path: Path, deep: bool = True) -> bool:
+    """
+    Check if a file is a valid ZIP archive.
+
+    Args:
+        archive_path: Path to ZIP file
+        deep: Decompress every member and check its CRC. When False, only the
+            central directory and each member's local header are checked,
+            which reads no file data.
+
+    Returns:
+        True if the archive is valid, False otherwise
+    """
     try:
         with zipfile.ZipFile(archive_path, "r") as zipf:
-            return zipf.testzip() is None
+            if deep:
+                return zipf.testzip() is None
+
+            # ZipFile has already parsed the central directory; confirm that
+            # every entry points at a local file header
+            with open(archive_path, "rb") as f:
+                for info in zipf.infolist():
+                    f.seek(info.header_offset)
+                    if f.read(4) != LOCAL_HEADER_SIGNATURE:
+                        return False
+            return True
     except (zipfile.BadZipFile, FileNotFoundError):
         return False
@@ -0,0 +1,34 @@
+"""Thread pool helper for per-file work."""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Iterable, List
+
+# Threads used to copy, hash, restore and extract files
+IO_WORKERS = min(8, os.cpu_count() or 1)
+
+# Below this many bytes in total, working on the calling thread beats a thread pool
+PARALLEL_MIN_BYTES = 4 * 1024 * 1024
+
+
+def map_files(func: Callable[..., Any], *iterables: Iterable, total_size: int) -> List[Any]:
+    """
+    Call func on each set of items from iterables and return the results in order.
+
+    Args:
+        func: Per-file work
+        *iterables: Arguments for func, one iterable per parameter
+        total_size: Combined size in bytes of the files being processed
+
+    Returns:
+        Results in the same order as the inputs. The calls run on up to
+        IO_WORKERS threads once there are several files totalling at least
+        PARALLEL_MIN_BYTES, and on the calling thread otherwise.
+    """
+    columns = [list(items) for items in iterables]
+    count = min(map(len, columns), default=0)
+    if count < 2 or total_size < PARALLEL_MIN_BYTES or IO_WORKERS < 2:
+        return list(map(func, *columns))
+
+    with ThreadPoolExecutor(max_workers=min(IO_WORKERS, count)) as executor:
+        return list(executor.map(func, *columns))
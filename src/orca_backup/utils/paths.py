@@ -1,7 +1,17 @@
 """Path utility functions."""
 
+import os
+import shutil
 from datetime import datetime
 from pathlib import Path
+from typing import Iterator, Optional, Union
+
+# RAM-backed directories to stage backups in, when available (Linux);
+# XDG_RUNTIME_DIR is also tried, read from the environment at call time
+RAM_STAGING_DIRS = ("/dev/shm",)
+
+# Free space a RAM-backed directory must keep beyond the staged files
+RAM_STAGING_MARGIN = 256 * 1024 * 1024
 
 
 def ensure_directory(path: Path) -> Path:
@@ -25,3 +35,40 @@ def get_backup_name(slicer_name: str, timestamp: datetime = None, compressed: bo
 def get_default_backup_dir() -> Path:
     """Get the default backup directory."""
     return Path.home() / "OrcaBackups"
+
+
+def get_staging_root(required_bytes: int) -> Optional[str]:
+    """
+    Get a RAM-backed directory for backup staging.
+
+    Args:
+        required_bytes: Estimated size of the files to be staged
+
+    Returns:
+        A writable tmpfs directory with room for required_bytes plus
+        RAM_STAGING_MARGIN, or None (meaning the system temp directory)
+    """
+    for candidate in (*RAM_STAGING_DIRS, os.environ.get("XDG_RUNTIME_DIR")):
+        if candidate and os.path.isdir(candidate) and os.access(candidate, os.W_OK):
+            try:
+                if shutil.disk_usage(candidate).free >= required_bytes + RAM_STAGING_MARGIN:
+                    return candidate
+            except OSError:
+                continue
+    return None
+
+
+def scandir_recursive(path: Union[str, Path]) -> Iterator[os.DirEntry]:
+    """
+    Yield a directory entry for every file below path.
+
+    Uses os.scandir so type checks come from the cached directory listing
+    instead of extra stat() calls. Symlinked directories are not descended
+    into; symlinks to files are yielded, like rglob() plus is_file().
+    """
+    with os.scandir(path) as it:
+        for entry in it:
+            if entry.is_dir(follow_symlinks=False):
+                yield from scandir_recursive(entry.path)
+            elif entry.is_file():
+                yield entry
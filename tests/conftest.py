@@ -2,33 +2,72 @@
 
 import json
 import shutil
-from datetime import datetime
 from pathlib import Path
 from typing import Tuple
 
 import pytest
 from typer.testing import CliRunner
 
+from orca_backup.core.backup import create_backup
 from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerInfo, SlicerType
+from tests.helpers import CREATED_AT
 
+MOCK_CONFIGS_DIR = Path(__file__).parent / "fixtures" / "mock_configs"
 
-@pytest.fixture
+# Mock installs contain scripts named like test modules (custom_scripts/test_script.py)
+collect_ignore = ["fixtures"]
+
+
+def pytest_addoption(parser):
+    """Register the --run-slow option."""
+    parser.addoption(
+        "--run-slow", action="store_true", default=False, help="Run tests marked as slow"
+    )
+
+
+def pytest_collection_modifyitems(config, items):
+    """Skip tests marked as slow unless --run-slow is given."""
+    if config.getoption("--run-slow"):
+        return
+
+    skip_slow = pytest.mark.skip(reason="slow test; use --run-slow to run")
+    for item in items:
+        if "slow" in item.keywords:
+            item.add_marker(skip_slow)
+
+
+@pytest.fixture(scope="session")
 def cli_runner():
-    """Typer CliRunner for CLI tests."""
+    """Typer CliRunner for CLI tests (stateless, so shared across the session)."""
     return CliRunner()
 
 
+@pytest.fixture
+def mock_slicer_paths(monkeypatch):
+    """
+    Point slicer detection at test directories.
+
+    Returns the dict get_slicer_paths will return; tests fill it in (and may
+    change it mid-test):
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
+    """
+    paths = {}
+    monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", lambda: paths)
+    return paths
+
+
 @pytest.fixture
 def fixtures_dir():
     """Path to test fixtures directory."""
-    return Path(__file__).parent / "fixtures"
+    return MOCK_CONFIGS_DIR.parent
 
 
 @pytest.fixture
-def mock_configs_dir(fixtures_dir):
-    """Path to mock config files."""
-    return fixtures_dir / "mock_configs"
+def mock_configs_dir():
+    """Path to mock slicer installations."""
+    return MOCK_CONFIGS_DIR
 
 
 @pytest.fixture
@@ -39,18 +78,9 @@ def temp_slicer_config(tmp_path, mock_configs_dir) -> Tuple[Path, Path, Path]:
     Returns:
         Tuple of (config_path, conf_file, user_dir)
     """
-    config_path = tmp_path / "OrcaSlicer"
-    config_path.mkdir()
-
-    # Copy conf file
-    conf_file = config_path / "OrcaSlicer.conf"
-    shutil.copy2(mock_configs_dir / "OrcaSlicer.conf", conf_file)
+    config_path = shutil.copytree(mock_configs_dir / "OrcaSlicer", tmp_path / "OrcaSlicer")
 
-    # Copy user directory
-    user_dir = config_path / "user"
-    shutil.copytree(mock_configs_dir / "user", user_dir)
-
-    return config_path, conf_file, user_dir
+    return config_path, config_path / "OrcaSlicer.conf", config_path / "user"
 
 
 @pytest.fixture
@@ -61,23 +91,26 @@ def temp_flashforge_config(tmp_path, mock_configs_dir) -> Tuple[Path, Path, Path
     Returns:
         Tuple of (config_path, conf_file, user_dir)
     """
-    config_path = tmp_path / "Orca-Flashforge"
-    config_path.mkdir()
+    config_path = shutil.copytree(
+        mock_configs_dir / "Orca-Flashforge", tmp_path / "Orca-Flashforge"
+    )
 
-    # Copy conf file
-    conf_file = config_path / "Orca-Flashforge.conf"
-    shutil.copy2(mock_configs_dir / "Orca-Flashforge.conf", conf_file)
+    return config_path, config_path / "Orca-Flashforge.conf", config_path / "user"
 
-    # Copy user directory
-    user_dir = config_path / "user"
-    shutil.copytree(mock_configs_dir / "user", user_dir)
 
-    # Create custom_scripts directory
-    custom_scripts_dir = config_path / "custom_scripts"
-    custom_scripts_dir.mkdir()
-    (custom_scripts_dir / "test_script.py").write_text("print('test')")
+@pytest.fixture(scope="session")
+def shared_slicer_install(tmp_path_factory) -> Tuple[Path, Path, Path]:
+    """
+    Shared mock OrcaSlicer installation for tests that never modify it.
+
+    Returns:
+        Tuple of (config_path, conf_file, user_dir)
+    """
+    config_path = shutil.copytree(
+        MOCK_CONFIGS_DIR / "OrcaSlicer", tmp_path_factory.mktemp("shared") / "OrcaSlicer"
+    )
 
-    return config_path, conf_file, user_dir
+    return config_path, config_path / "OrcaSlicer.conf", config_path / "user"
 
 
 @pytest.fixture
@@ -97,6 +130,35 @@ def sample_slicer_info(temp_slicer_config) -> SlicerInfo:
     )
 
 
+@pytest.fixture(scope="session")
+def sample_slicer_info_ro(shared_slicer_install) -> SlicerInfo:
+    """Create a SlicerInfo for the shared, read-only OrcaSlicer installation."""
+    config_path, conf_file, user_dir = shared_slicer_install
+
+    return SlicerInfo(
+        name=SlicerType.ORCASLICER,
+        display_name="OrcaSlicer",
+        config_path=config_path,
+        exists=True,
+        version="2.1.0-beta",
+        conf_file=conf_file,
+        user_dir=user_dir,
+        custom_scripts_dir=None,
+    )
+
+
+@pytest.fixture(scope="session")
+def prebuilt_backup_zip(tmp_path_factory, sample_slicer_info_ro) -> Path:
+    """
+    Create one compressed OrcaSlicer backup shared across tests.
+
+    Built without verification: the verify and restore tests that use it
+    check its integrity themselves.
+    """
+    output_dir = tmp_path_factory.mktemp("prebuilt")
+    return create_backup(sample_slicer_info_ro, output_dir, compress=True, verify=False)
+
+
 @pytest.fixture
 def sample_flashforge_info(temp_flashforge_config) -> SlicerInfo:
     """Create a sample Orca-Flashforge SlicerInfo object."""
@@ -115,21 +177,26 @@ def sample_flashforge_info(temp_flashforge_config) -> SlicerInfo:
     )
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_file_entries() -> list:
-    """Create sample FileEntry objects."""
+    """
+    Create sample FileEntry objects (shared; treat as read-only).
+
+    The values are known-good, so pydantic validation is skipped; tests of
+    the validators construct their own models.
+    """
     return [
-        FileEntry(
+        FileEntry.model_construct(
             path="OrcaSlicer.conf",
             size=1024,
             sha256="a" * 64,
         ),
-        FileEntry(
+        FileEntry.model_construct(
             path="user/filament/custom_pla.json",
             size=256,
             sha256="b" * 64,
         ),
-        FileEntry(
+        FileEntry.model_construct(
             path="user/process/custom_profile.json",
             size=512,
             sha256="c" * 64,
@@ -137,12 +204,12 @@ def sample_file_entries() -> list:
     ]
 
 
-@pytest.fixture
+@pytest.fixture(scope="session")
 def sample_backup_manifest(sample_file_entries) -> BackupManifest:
-    """Create a sample BackupManifest object."""
-    return BackupManifest(
+    """Create a sample BackupManifest object (shared; treat as read-only; not validated)."""
+    return BackupManifest.model_construct(
         version="1.0",
-        created_at=datetime(2025, 11, 14, 12, 0, 0),
+        created_at=CREATED_AT,
         slicer="orcaslicer",
         slicer_version="2.1.0-beta",
         platform="linux",
@@ -153,6 +220,12 @@ def sample_backup_manifest(sample_file_entries) -> BackupManifest:
     )
 
 
+@pytest.fixture(scope="session")
+def sample_manifest_json(sample_backup_manifest) -> bytes:
+    """sample_backup_manifest serialized as backup_manifest.json contents, once per session."""
+    return sample_backup_manifest.model_dump_json().encode()
+
+
 @pytest.fixture
 def sample_conf_content():
     """Sample OrcaSlicer.conf JSON content."""
@@ -171,6 +244,14 @@ def sample_conf_content():
     }
 
 
+# platform.system() return values for each mock_platform parameter
+PLATFORM_SYSTEMS = {
+    "windows": "Windows",
+    "darwin": "Darwin",
+    "linux": "Linux",
+}
+
+
 @pytest.fixture
 def mock_platform(monkeypatch, request):
     """
@@ -179,15 +260,11 @@ def mock_platform(monkeypatch, request):
     Usage:
         @pytest.mark.parametrize("mock_platform", ["windows", "darwin", "linux"], indirect=True)
     """
-    system = request.param if hasattr(request, "param") else "linux"
+    system = getattr(request, "param", "linux")
+    system_name = PLATFORM_SYSTEMS[system]
 
-    system_map = {
-        "windows": "Windows",
-        "darwin": "Darwin",
-        "linux": "Linux",
-    }
-
-    monkeypatch.setattr("platform.system", lambda: system_map[system])
+    # The detector calls platform.system() through the shared module object
+    monkeypatch.setattr("platform.system", lambda: system_name)
     return system
 
 
@@ -212,18 +289,18 @@ def create_test_files(tmp_path):
         Returns:
             List of created file paths
         """
-        created_files = []
-        for path_str, content in file_specs:
-            file_path = tmp_path / path_str
-            file_path.parent.mkdir(parents=True, exist_ok=True)
+        created_files = [tmp_path / path_str for path_str, _ in file_specs]
+
+        # Create each parent directory once, not once per file
+        for parent in {file_path.parent for file_path in created_files}:
+            parent.mkdir(parents=True, exist_ok=True)
 
+        for file_path, (_, content) in zip(created_files, file_specs):
             if isinstance(content, bytes):
                 file_path.write_bytes(content)
             else:
                 file_path.write_text(content)
 
-            created_files.append(file_path)
-
         return created_files
 
     return _create_files
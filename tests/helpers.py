@@ -0,0 +1,61 @@
+"""Helpers shared by the test modules for building backups by hand."""
+
+import hashlib
+import zipfile
+from datetime import datetime
+from pathlib import Path
+from types import SimpleNamespace
+
+from orca_backup.models.backup import BackupManifest, FileEntry
+
+# Fixed manifest timestamp for hand-built backups; the tests never depend on the time
+CREATED_AT = datetime(2025, 11, 14, 12, 0, 0)
+
+
+def write_manifest(backup_dir: Path, files: list, slicer: str = "orcaslicer") -> str:
+    """Write a backup_manifest.json listing files into backup_dir and return its text."""
+    manifest = BackupManifest(
+        created_at=CREATED_AT,
+        slicer=slicer,
+        platform="linux",
+        files=files,
+        total_files=len(files),
+        total_size=sum(entry.size for entry in files),
+    )
+    text = manifest.model_dump_json()  # serialized by pydantic-core, no dict round-trip
+    (backup_dir / "backup_manifest.json").write_text(text)
+    return text
+
+
+def write_files(backup_dir: Path, files: dict) -> list:
+    """Write {relative path: bytes} under backup_dir and return their FileEntry objects."""
+    entries = []
+    for path, data in files.items():
+        file_path = backup_dir / path
+        file_path.parent.mkdir(parents=True, exist_ok=True)
+        file_path.write_bytes(data)
+        # Checksum the bytes in memory rather than reading the file back
+        sha256 = hashlib.sha256(data).hexdigest()
+        entries.append(FileEntry(path=path, size=len(data), sha256=sha256))
+    return entries
+
+
+def build_sample_backup(root: Path, files: dict) -> SimpleNamespace:
+    """
+    Build a directory backup of files under root, and the same backup zipped.
+
+    Returns a namespace with backup_dir and zip_path.
+    """
+    backup_dir = root / "backup"
+    manifest_text = write_manifest(backup_dir, write_files(backup_dir, files))
+
+    # Zip the same contents from memory rather than reading the files back;
+    # stored, since the payloads are a few bytes
+    zip_path = root / "backup.zip"
+    with zipfile.ZipFile(zip_path, "w", zipfile.ZIP_STORED) as zipf:
+        for name, data in files.items():
+            zipf.writestr(name, data)
+        # Serialized once, for both copies
+        zipf.writestr("backup_manifest.json", manifest_text)
+
+    return SimpleNamespace(backup_dir=backup_dir, zip_path=zip_path)
@@ -1,9 +1,12 @@
 """Integration tests for full backup workflow."""
 
-import json
+import os
 import zipfile
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime
 from pathlib import Path
 
+import orjson
 import pytest
 
 from orca_backup.core.backup import create_backup
@@ -15,13 +18,13 @@ from orca_backup.models.slicer import SlicerType
 class TestBackupWorkflow:
     """Integration tests for complete backup workflow."""
 
-    def test_full_backup_creation_compressed(self, sample_slicer_info, tmp_path):
+    def test_full_backup_creation_compressed(self, sample_slicer_info_ro, tmp_path):
         """Test complete backup creation workflow with compression."""
         output_dir = tmp_path / "backups"
 
         # Create backup
         backup_path = create_backup(
-            sample_slicer_info, output_dir, compress=True, verify=True
+            sample_slicer_info_ro, output_dir, compress=True, verify=False
         )
 
         # Verify backup was created
@@ -29,30 +32,27 @@ class TestBackupWorkflow:
         assert backup_path.is_file()
         assert backup_path.suffix == ".zip"
 
-        # Verify it's a valid ZIP
-        assert zipfile.is_zipfile(backup_path)
-
         # Verify backup passes verification
         assert verify_backup(backup_path, verbose=False) is True
 
-        # Verify manifest is in ZIP
+        # Verify it's a valid ZIP containing the manifest
         with zipfile.ZipFile(backup_path, "r") as zipf:
-            assert "backup_manifest.json" in zipf.namelist()
-            assert "OrcaSlicer.conf" in zipf.namelist()
+            names = zipf.namelist()
+            assert "backup_manifest.json" in names
+            assert "OrcaSlicer.conf" in names
 
             # Check manifest content
-            with zipf.open("backup_manifest.json") as f:
-                manifest_data = json.load(f)
-                assert manifest_data["slicer"] == "orcaslicer"
-                assert manifest_data["version"] == "1.0"
-                assert "files" in manifest_data
+            manifest_data = orjson.loads(zipf.read("backup_manifest.json"))
+            assert manifest_data["slicer"] == "orcaslicer"
+            assert manifest_data["version"] == "1.0"
+            assert "files" in manifest_data
 
-    def test_full_backup_creation_uncompressed(self, sample_slicer_info, tmp_path):
+    def test_full_backup_creation_uncompressed(self, sample_slicer_info_ro, tmp_path):
         """Test complete backup creation workflow without compression."""
         output_dir = tmp_path / "backups"
 
         backup_path = create_backup(
-            sample_slicer_info, output_dir, compress=False, verify=True
+            sample_slicer_info_ro, output_dir, compress=False, verify=False
         )
 
         # Verify backup was created as directory
@@ -70,26 +70,22 @@ class TestBackupWorkflow:
         assert (backup_path / "OrcaSlicer.conf").exists()
         assert (backup_path / "user").exists()
 
-    def test_backup_manifest_integrity(self, sample_slicer_info, tmp_path):
+    def test_backup_manifest_integrity(self, sample_slicer_info_ro, tmp_path):
         """Test that manifest accurately reflects backup contents."""
         output_dir = tmp_path / "backups"
 
         backup_path = create_backup(
-            sample_slicer_info, output_dir, compress=False, verify=False
+            sample_slicer_info_ro, output_dir, compress=False, verify=False
         )
 
         # Load manifest
         manifest_file = backup_path / "backup_manifest.json"
-        with open(manifest_file, "r") as f:
-            manifest_data = json.load(f)
+        manifest_data = orjson.loads(manifest_file.read_bytes())
 
-        # Verify all files in manifest exist
+        # Verify all files in manifest exist and sizes match
+        # (stat() raises FileNotFoundError for a missing file)
         for file_entry in manifest_data["files"]:
-            file_path = backup_path / file_entry["path"]
-            assert file_path.exists()
-
-            # Verify size matches
-            actual_size = file_path.stat().st_size
+            actual_size = (backup_path / file_entry["path"]).stat().st_size
             assert actual_size == file_entry["size"]
 
     def test_backup_flashforge_with_custom_scripts(
@@ -107,8 +103,7 @@ class TestBackupWorkflow:
 
         # Verify in manifest
         manifest_file = backup_path / "backup_manifest.json"
-        with open(manifest_file, "r") as f:
-            manifest_data = json.load(f)
+        manifest_data = orjson.loads(manifest_file.read_bytes())
 
         script_files = [
             f for f in manifest_data["files"] if f["path"].startswith("custom_scripts/")
@@ -116,20 +111,15 @@ class TestBackupWorkflow:
         assert len(script_files) > 0
 
     def test_backup_all_installed_slicers(
-        self, temp_slicer_config, temp_flashforge_config, tmp_path, monkeypatch
+        self, temp_slicer_config, temp_flashforge_config, tmp_path, mock_slicer_paths
     ):
         """Test backing up all installed slicers."""
         orca_path, _, _ = temp_slicer_config
         flash_path, _, _ = temp_flashforge_config
 
-        # Mock get_slicer_paths to return our test paths
-        def mock_paths():
-            return {
-                "orcaslicer": orca_path,
-                "orca-flashforge": flash_path,
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        # Point slicer detection at our test paths
+        mock_slicer_paths["orcaslicer"] = orca_path
+        mock_slicer_paths["orca-flashforge"] = flash_path
 
         output_dir = tmp_path / "backups"
 
@@ -137,11 +127,14 @@ class TestBackupWorkflow:
         slicers = get_installed_slicers()
         assert len(slicers) == 2
 
-        # Create backups for all
-        backup_paths = []
-        for slicer in slicers:
-            backup_path = create_backup(slicer, output_dir, compress=True, verify=True)
-            backup_paths.append(backup_path)
+        # Create backups for all (names differ per slicer, so they can run concurrently)
+        with ThreadPoolExecutor(max_workers=len(slicers)) as executor:
+            backup_paths = list(
+                executor.map(
+                    lambda slicer: create_backup(slicer, output_dir, compress=True, verify=False),
+                    slicers,
+                )
+            )
 
         # Verify both backups were created
         assert len(backup_paths) == 2
@@ -149,45 +142,48 @@ class TestBackupWorkflow:
             assert backup_path.exists()
             assert verify_backup(backup_path, verbose=False) is True
 
-    def test_backup_output_directory_creation(self, sample_slicer_info, tmp_path):
+    def test_backup_output_directory_creation(self, sample_slicer_info_ro, tmp_path):
         """Test that output directory is created if it doesn't exist."""
         # Use nested non-existent directory
         output_dir = tmp_path / "level1" / "level2" / "backups"
         assert not output_dir.exists()
 
         backup_path = create_backup(
-            sample_slicer_info, output_dir, compress=True, verify=False
+            sample_slicer_info_ro, output_dir, compress=True, verify=False
         )
 
         # Verify directory was created
         assert output_dir.exists()
         assert backup_path.parent == output_dir
 
-    def test_backup_preserves_file_structure(self, sample_slicer_info, tmp_path):
+    def test_backup_preserves_file_structure(self, sample_slicer_info_ro, tmp_path):
         """Test that backup preserves original file structure."""
         output_dir = tmp_path / "backups"
 
         backup_path = create_backup(
-            sample_slicer_info, output_dir, compress=False, verify=False
+            sample_slicer_info_ro, output_dir, compress=False, verify=False
         )
 
         # Verify directory structure matches original
-        original_user_dir = sample_slicer_info.user_dir
+        original_user_dir = sample_slicer_info_ro.user_dir
         backup_user_dir = backup_path / "user"
 
-        # Check that subdirectories exist
-        for subdir in original_user_dir.rglob("*"):
-            if subdir.is_dir():
-                relative_path = subdir.relative_to(original_user_dir)
-                backup_subdir = backup_user_dir / relative_path
-                assert backup_subdir.exists()
+        def relative_dirs(root):
+            return {
+                os.path.relpath(os.path.join(dirpath, d), root)
+                for dirpath, dirnames, _ in os.walk(root)
+                for d in dirnames
+            }
+
+        # Check that every original subdirectory exists in the backup
+        assert relative_dirs(original_user_dir) <= relative_dirs(backup_user_dir)
 
-    def test_backup_naming_convention(self, sample_slicer_info, tmp_path):
+    def test_backup_naming_convention(self, sample_slicer_info_ro, tmp_path):
         """Test that backup follows naming convention."""
         output_dir = tmp_path / "backups"
 
         backup_path = create_backup(
-            sample_slicer_info, output_dir, compress=True, verify=False
+            sample_slicer_info_ro, output_dir, compress=True, verify=False
         )
 
         # Check naming pattern: {Slicer}_backup_{timestamp}.zip
@@ -200,21 +196,25 @@ class TestBackupWorkflow:
         timestamp_part = name_parts[1]
         assert len(timestamp_part) == 19  # YYYY-MM-DD_HH-MM-SS
 
-    def test_multiple_backups_different_names(self, sample_slicer_info, tmp_path):
+    def test_multiple_backups_different_names(self, sample_slicer_info_ro, tmp_path, monkeypatch):
         """Test that multiple backups get different names."""
         output_dir = tmp_path / "backups"
 
-        # Create two backups (small delay to ensure different timestamps)
-        backup1 = create_backup(
-            sample_slicer_info, output_dir, compress=True, verify=False
-        )
+        # Advance the clock one second per call instead of sleeping
+        timestamps = iter([datetime(2025, 11, 14, 12, 0, 0), datetime(2025, 11, 14, 12, 0, 1)])
 
-        import time
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return next(timestamps)
 
-        time.sleep(1.1)  # Wait to ensure different timestamp
+        monkeypatch.setattr("orca_backup.core.backup.datetime", FakeDatetime)
 
+        backup1 = create_backup(
+            sample_slicer_info_ro, output_dir, compress=True, verify=False
+        )
         backup2 = create_backup(
-            sample_slicer_info, output_dir, compress=True, verify=False
+            sample_slicer_info_ro, output_dir, compress=True, verify=False
         )
 
         # Verify different names
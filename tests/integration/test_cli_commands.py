@@ -1,41 +1,28 @@
 """Integration tests for CLI commands."""
 
-import pytest
-
 from orca_backup.cli import app
-from orca_backup.models.slicer import SlicerType
 
 
 class TestListCommand:
     """Tests for 'list' CLI command."""
 
-    def test_list_no_slicers(self, cli_runner, tmp_path, monkeypatch):
+    def test_list_no_slicers(self, cli_runner, tmp_path, mock_slicer_paths):
         """Test list command when no slicers are found."""
 
-        def mock_paths():
-            return {
-                "orcaslicer": tmp_path / "NonExistent1",
-                "orca-flashforge": tmp_path / "NonExistent2",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = tmp_path / "NonExistent1"
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "NonExistent2"
 
         result = cli_runner.invoke(app, ["list"])
 
         assert result.exit_code == 0
         assert "0/2" in result.stdout
 
-    def test_list_with_slicers(self, cli_runner, temp_slicer_config, monkeypatch):
+    def test_list_with_slicers(self, cli_runner, shared_slicer_install, mock_slicer_paths):
         """Test list command with installed slicers."""
-        config_path, _, _ = temp_slicer_config
-
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
+        config_path, _, _ = shared_slicer_install
 
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         result = cli_runner.invoke(app, ["list"])
 
@@ -48,19 +35,14 @@ class TestBackupCommand:
     """Tests for 'backup' CLI command."""
 
     def test_backup_single_slicer(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+        self, cli_runner, shared_slicer_install, tmp_path, mock_slicer_paths
     ):
         """Test backing up a single slicer."""
-        config_path, _, _ = temp_slicer_config
+        config_path, _, _ = shared_slicer_install
         output_dir = tmp_path / "backups"
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         result = cli_runner.invoke(
             app, ["backup", "--slicer", "orcaslicer", "--output", str(output_dir)]
@@ -76,20 +58,15 @@ class TestBackupCommand:
         temp_slicer_config,
         temp_flashforge_config,
         tmp_path,
-        monkeypatch,
+        mock_slicer_paths,
     ):
         """Test backing up all installed slicers."""
         orca_path, _, _ = temp_slicer_config
         flash_path, _, _ = temp_flashforge_config
         output_dir = tmp_path / "backups"
 
-        def mock_paths():
-            return {
-                "orcaslicer": orca_path,
-                "orca-flashforge": flash_path,
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = orca_path
+        mock_slicer_paths["orca-flashforge"] = flash_path
 
         result = cli_runner.invoke(
             app, ["backup", "--slicer", "all", "--output", str(output_dir)]
@@ -100,19 +77,14 @@ class TestBackupCommand:
         assert "Orca-Flashforge" in result.stdout
 
     def test_backup_no_compress(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+        self, cli_runner, shared_slicer_install, tmp_path, mock_slicer_paths
     ):
         """Test creating uncompressed backup."""
-        config_path, _, _ = temp_slicer_config
+        config_path, _, _ = shared_slicer_install
         output_dir = tmp_path / "backups"
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         result = cli_runner.invoke(
             app,
@@ -133,19 +105,14 @@ class TestBackupCommand:
         assert backups[0].is_dir()
 
     def test_backup_no_verify(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+        self, cli_runner, shared_slicer_install, tmp_path, mock_slicer_paths
     ):
         """Test backup without verification."""
-        config_path, _, _ = temp_slicer_config
+        config_path, _, _ = shared_slicer_install
         output_dir = tmp_path / "backups"
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         result = cli_runner.invoke(
             app,
@@ -170,16 +137,11 @@ class TestBackupCommand:
         assert result.exit_code == 1
         assert "ERROR" in result.stdout
 
-    def test_backup_slicer_not_found(self, cli_runner, tmp_path, monkeypatch):
+    def test_backup_slicer_not_found(self, cli_runner, tmp_path, mock_slicer_paths):
         """Test backup when slicer is not found."""
 
-        def mock_paths():
-            return {
-                "orcaslicer": tmp_path / "NonExistent",
-                "orca-flashforge": tmp_path / "NonExistent2",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = tmp_path / "NonExistent"
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "NonExistent2"
 
         result = cli_runner.invoke(
             app, ["backup", "--slicer", "orcaslicer", "--output", str(tmp_path)]
@@ -188,38 +150,26 @@ class TestBackupCommand:
         assert result.exit_code == 1
         assert "not found" in result.stdout
 
-    def test_backup_all_no_slicers(self, cli_runner, tmp_path, monkeypatch):
+    def test_backup_all_no_slicers(self, cli_runner, tmp_path, mock_slicer_paths):
         """Test backup all when no slicers are installed."""
 
-        def mock_paths():
-            return {
-                "orcaslicer": tmp_path / "NonExistent",
-                "orca-flashforge": tmp_path / "NonExistent2",
-            }
+        mock_slicer_paths["orcaslicer"] = tmp_path / "NonExistent"
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "NonExistent2"
 
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
-
-        result = cli_runner.invoke(
-            app, ["backup", "--slicer", "all", "--output", str(tmp_path)]
-        )
+        result = cli_runner.invoke(app, ["backup", "--slicer", "all", "--output", str(tmp_path)])
 
         assert result.exit_code == 1
         assert "No installed slicers found" in result.stdout
 
     def test_backup_verbose(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+        self, cli_runner, shared_slicer_install, tmp_path, mock_slicer_paths
     ):
         """Test backup with verbose output."""
-        config_path, _, _ = temp_slicer_config
+        config_path, _, _ = shared_slicer_install
         output_dir = tmp_path / "backups"
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         result = cli_runner.invoke(
             app,
@@ -242,75 +192,34 @@ class TestRestoreCommand:
     """Tests for 'restore' CLI command."""
 
     def test_restore_from_backup(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+        self, cli_runner, prebuilt_backup_zip, tmp_path, mock_slicer_paths
     ):
         """Test restoring from a backup."""
-        source_path, _, _ = temp_slicer_config
-
-        # Create backup first
-        def mock_paths_backup():
-            return {
-                "orcaslicer": source_path,
-                "orca-flashforge": source_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_backup
-        )
-
-        from orca_backup.core.backup import create_backup
-        from orca_backup.core.detector import get_slicer_info
-
-        slicer = get_slicer_info(SlicerType.ORCASLICER)
-        backup_path = create_backup(
-            slicer, tmp_path / "backups", compress=True, verify=True
-        )
-
         # Create target for restore
         target_path = tmp_path / "restored" / "OrcaSlicer"
         target_path.mkdir(parents=True)
 
-        def mock_paths_restore():
-            return {
-                "orcaslicer": target_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = target_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         result = cli_runner.invoke(
-            app, ["restore", str(backup_path), "--no-backup"]
+            app, ["restore", str(prebuilt_backup_zip), "--no-backup"]
         )
 
         assert result.exit_code == 0
         assert "Restore completed successfully" in result.stdout
 
     def test_restore_dry_run(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
+        self, cli_runner, prebuilt_backup_zip, shared_slicer_install, mock_slicer_paths
     ):
         """Test restore with dry-run flag."""
-        source_path, _, _ = temp_slicer_config
-
-        def mock_paths():
-            return {
-                "orcaslicer": source_path,
-                "orca-flashforge": source_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        config_path, _, _ = shared_slicer_install
 
-        from orca_backup.core.backup import create_backup
-        from orca_backup.core.detector import get_slicer_info
-
-        slicer = get_slicer_info(SlicerType.ORCASLICER)
-        backup_path = create_backup(
-            slicer, tmp_path / "backups", compress=True, verify=True
-        )
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         result = cli_runner.invoke(
-            app, ["restore", str(backup_path), "--dry-run"]
+            app, ["restore", str(prebuilt_backup_zip), "--dry-run"]
         )
 
         assert result.exit_code == 0
@@ -329,29 +238,9 @@ class TestRestoreCommand:
 class TestVerifyCommand:
     """Tests for 'verify' CLI command."""
 
-    def test_verify_valid_backup(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
-    ):
+    def test_verify_valid_backup(self, cli_runner, prebuilt_backup_zip):
         """Test verifying a valid backup."""
-        config_path, _, _ = temp_slicer_config
-
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
-
-        from orca_backup.core.backup import create_backup
-        from orca_backup.core.detector import get_slicer_info
-
-        slicer = get_slicer_info(SlicerType.ORCASLICER)
-        backup_path = create_backup(
-            slicer, tmp_path / "backups", compress=True, verify=True
-        )
-
-        result = cli_runner.invoke(app, ["verify", str(backup_path)])
+        result = cli_runner.invoke(app, ["verify", str(prebuilt_backup_zip)])
 
         assert result.exit_code == 0
         assert "verification passed" in result.stdout.lower()
@@ -377,29 +266,9 @@ class TestVerifyCommand:
 class TestInfoCommand:
     """Tests for 'info' CLI command."""
 
-    def test_info_valid_backup(
-        self, cli_runner, temp_slicer_config, tmp_path, monkeypatch
-    ):
+    def test_info_valid_backup(self, cli_runner, prebuilt_backup_zip):
         """Test displaying info for valid backup."""
-        config_path, _, _ = temp_slicer_config
-
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
-
-        from orca_backup.core.backup import create_backup
-        from orca_backup.core.detector import get_slicer_info
-
-        slicer = get_slicer_info(SlicerType.ORCASLICER)
-        backup_path = create_backup(
-            slicer, tmp_path / "backups", compress=True, verify=True
-        )
-
-        result = cli_runner.invoke(app, ["info", str(backup_path)])
+        result = cli_runner.invoke(app, ["info", str(prebuilt_backup_zip)])
 
         assert result.exit_code == 0
         assert "Backup Information" in result.stdout
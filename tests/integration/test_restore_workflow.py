@@ -1,41 +1,63 @@
 """Integration tests for full restore workflow."""
 
-import json
+import os
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
 import pytest
 
 from orca_backup.core.backup import create_backup
+from orca_backup.core.detector import get_slicer_info
 from orca_backup.core.restore import restore_backup
 from orca_backup.core.verify import calculate_sha256
+from orca_backup.models.backup import BackupManifest, FileEntry
 from orca_backup.models.slicer import SlicerType
+from orca_backup.utils.paths import scandir_recursive
+
+
+def snapshot(root):
+    """Return the relative paths of every file and directory under root."""
+    return frozenset(
+        os.path.relpath(os.path.join(dirpath, name), root)
+        for dirpath, dirnames, filenames in os.walk(root)
+        for name in dirnames + filenames
+    )
+
+
+def tree_signature(root):
+    """Return sorted (relative path, size) pairs for every file under root."""
+    return sorted(
+        (str(Path(entry.path).relative_to(root)), entry.stat().st_size)
+        for entry in scandir_recursive(root)
+    )
+
+
+def checksums_under(root):
+    """Map each file's path relative to root to its SHA256, hashing on threads."""
+    paths = [Path(entry.path) for entry in scandir_recursive(root)]
+    with ThreadPoolExecutor() as executor:
+        checksums = executor.map(calculate_sha256, paths)
+        return {str(path.relative_to(root)): checksum for path, checksum in zip(paths, checksums)}
 
 
 class TestRestoreWorkflow:
     """Integration tests for complete restore workflow."""
 
     def test_full_backup_restore_cycle(
-        self, temp_slicer_config, tmp_path, monkeypatch
+        self, temp_slicer_config, tmp_path, mock_slicer_paths
     ):
         """Test complete backup and restore cycle."""
         source_config_path, source_conf, source_user = temp_slicer_config
 
         # Mock slicer paths
-        def mock_paths():
-            return {
-                "orcaslicer": source_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = source_config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         # Create backup
         output_dir = tmp_path / "backups"
-        from orca_backup.core.detector import get_slicer_info
-
         source_slicer = get_slicer_info(SlicerType.ORCASLICER)
         backup_path = create_backup(
-            source_slicer, output_dir, compress=True, verify=True
+            source_slicer, output_dir, compress=True, verify=False
         )
 
         # Create new target directory (simulate different machine)
@@ -43,15 +65,7 @@ class TestRestoreWorkflow:
         target_config_path.mkdir(parents=True)
 
         # Mock paths for restore
-        def mock_paths_restore():
-            return {
-                "orcaslicer": target_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = target_config_path
 
         # Restore backup
         success = restore_backup(backup_path, backup_existing=False)
@@ -67,83 +81,87 @@ class TestRestoreWorkflow:
         restored_conf_content = (target_config_path / "OrcaSlicer.conf").read_text()
         assert restored_conf_content == original_conf_content
 
+    @pytest.mark.parametrize("compress", [True, False], ids=["zip", "directory"])
+    def test_restore_skips_unchanged_files(
+        self, temp_slicer_config, tmp_path, mock_slicer_paths, compress
+    ):
+        """Test that restoring over an unchanged file leaves it untouched, for either format."""
+        config_path, conf_file, user_dir = temp_slicer_config
+
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
+
+        backup_path = create_backup(
+            get_slicer_info(SlicerType.ORCASLICER),
+            tmp_path / "backups",
+            compress=compress,
+            verify=False,
+        )
+
+        # Mark the conf file with an old timestamp and change a profile
+        os.utime(conf_file, ns=(1_000_000_000, 1_000_000_000))
+        profile = user_dir / "filament" / "custom_pla.json"
+        original_profile = profile.read_text()
+        profile.write_text('{"changed": true}')
+
+        # A same-size edit is only caught by the checksum
+        process = user_dir / "process" / "custom_profile.json"
+        original_process = process.read_bytes()
+        process.write_bytes(original_process.swapcase())
+
+        assert restore_backup(backup_path, backup_existing=False) is True
+
+        assert conf_file.stat().st_mtime_ns == 1_000_000_000
+        assert profile.read_text() == original_profile
+        assert process.read_bytes() == original_process
+
     def test_restore_preserves_checksums(
-        self, temp_slicer_config, tmp_path, monkeypatch
+        self, temp_slicer_config, tmp_path, mock_slicer_paths
     ):
         """Test that restored files have same checksums as originals."""
         source_config_path, source_conf, source_user = temp_slicer_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": source_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
+        mock_slicer_paths["orcaslicer"] = source_config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
-
-        # Calculate original checksums
-        original_checksums = {}
-        for file_path in source_config_path.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(source_config_path)
-                original_checksums[str(relative_path)] = calculate_sha256(file_path)
+        # Hash the originals independently of anything the backup records
+        original_checksums = checksums_under(source_config_path)
 
         # Create backup
         output_dir = tmp_path / "backups"
-        from orca_backup.core.detector import get_slicer_info
-
         source_slicer = get_slicer_info(SlicerType.ORCASLICER)
         backup_path = create_backup(
-            source_slicer, output_dir, compress=True, verify=True
+            source_slicer, output_dir, compress=True, verify=False
         )
 
         # Restore to new location
         target_config_path = tmp_path / "restored" / "OrcaSlicer"
         target_config_path.mkdir(parents=True)
 
-        def mock_paths_restore():
-            return {
-                "orcaslicer": target_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = target_config_path
 
         restore_backup(backup_path, backup_existing=False)
 
-        # Calculate restored checksums
-        restored_checksums = {}
-        for file_path in target_config_path.rglob("*"):
-            if file_path.is_file():
-                relative_path = file_path.relative_to(target_config_path)
-                restored_checksums[str(relative_path)] = calculate_sha256(file_path)
+        # Same files with the same sizes (stat only) before hashing anything
+        assert tree_signature(target_config_path) == tree_signature(source_config_path)
 
-        # Verify checksums match
-        assert original_checksums == restored_checksums
+        # Restored files match the originals byte for byte
+        assert checksums_under(target_config_path) == original_checksums
 
     def test_restore_with_existing_backup(
-        self, temp_slicer_config, tmp_path, monkeypatch
+        self, temp_slicer_config, tmp_path, mock_slicer_paths
     ):
         """Test that existing config is backed up before restore."""
         source_config_path, _, _ = temp_slicer_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": source_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = source_config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         # Create backup
         output_dir = tmp_path / "backups"
-        from orca_backup.core.detector import get_slicer_info
-
         source_slicer = get_slicer_info(SlicerType.ORCASLICER)
         backup_path = create_backup(
-            source_slicer, output_dir, compress=True, verify=True
+            source_slicer, output_dir, compress=True, verify=False
         )
 
         # Create target with existing config
@@ -157,15 +175,7 @@ class TestRestoreWorkflow:
         existing_user.mkdir()
         (existing_user / "existing_file.txt").write_text("existing")
 
-        def mock_paths_restore():
-            return {
-                "orcaslicer": target_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = target_config_path
 
         # Restore with backup_existing=True
         restore_backup(backup_path, backup_existing=True)
@@ -179,26 +189,19 @@ class TestRestoreWorkflow:
         assert len(backup_files) >= 1
 
     def test_restore_dry_run_no_changes(
-        self, temp_slicer_config, tmp_path, monkeypatch
+        self, temp_slicer_config, tmp_path, mock_slicer_paths
     ):
         """Test that dry-run doesn't modify any files."""
         source_config_path, _, _ = temp_slicer_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": source_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = source_config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         # Create backup
         output_dir = tmp_path / "backups"
-        from orca_backup.core.detector import get_slicer_info
-
         source_slicer = get_slicer_info(SlicerType.ORCASLICER)
         backup_path = create_backup(
-            source_slicer, output_dir, compress=True, verify=True
+            source_slicer, output_dir, compress=True, verify=False
         )
 
         # Create empty target
@@ -206,46 +209,31 @@ class TestRestoreWorkflow:
         target_config_path.mkdir(parents=True)
 
         # Record state before dry-run
-        files_before = set(target_config_path.rglob("*"))
+        files_before = snapshot(target_config_path)
 
-        def mock_paths_restore():
-            return {
-                "orcaslicer": target_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = target_config_path
 
         # Dry-run restore
         restore_backup(backup_path, dry_run=True, backup_existing=False)
 
         # Verify no files were created
-        files_after = set(target_config_path.rglob("*"))
+        files_after = snapshot(target_config_path)
         assert files_before == files_after
 
     def test_restore_uncompressed_backup(
-        self, temp_slicer_config, tmp_path, monkeypatch
+        self, temp_slicer_config, tmp_path, mock_slicer_paths
     ):
         """Test restoring from uncompressed backup."""
         source_config_path, source_conf, _ = temp_slicer_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": source_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = source_config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         # Create uncompressed backup
         output_dir = tmp_path / "backups"
-        from orca_backup.core.detector import get_slicer_info
-
         source_slicer = get_slicer_info(SlicerType.ORCASLICER)
         backup_path = create_backup(
-            source_slicer, output_dir, compress=False, verify=True
+            source_slicer, output_dir, compress=False, verify=False
         )
 
         assert backup_path.is_dir()
@@ -254,22 +242,14 @@ class TestRestoreWorkflow:
         target_config_path = tmp_path / "restored" / "OrcaSlicer"
         target_config_path.mkdir(parents=True)
 
-        def mock_paths_restore():
-            return {
-                "orcaslicer": target_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = target_config_path
 
         success = restore_backup(backup_path, backup_existing=False)
 
         assert success is True
         assert (target_config_path / "OrcaSlicer.conf").exists()
 
-    def test_cross_platform_restore_manifest(self, tmp_path, monkeypatch):
+    def test_cross_platform_restore_manifest(self, tmp_path, mock_slicer_paths):
         """Test that backup from one platform can be read on another."""
         # Create a backup manifest as if from different platform
         backup_dir = tmp_path / "backup"
@@ -279,8 +259,6 @@ class TestRestoreWorkflow:
         conf_file = backup_dir / "OrcaSlicer.conf"
         conf_file.write_text('{"test": "data"}')
 
-        from orca_backup.models.backup import BackupManifest, FileEntry
-
         # Create manifest with different platform
         manifest = BackupManifest(
             created_at="2025-11-14T12:00:00",
@@ -299,20 +277,14 @@ class TestRestoreWorkflow:
         )
 
         manifest_file = backup_dir / "backup_manifest.json"
-        with open(manifest_file, "w") as f:
-            json.dump(manifest.model_dump(mode="json"), f, default=str)
+        manifest_file.write_text(manifest.model_dump_json())
 
         # Restore on current platform
         target_config_path = tmp_path / "target" / "OrcaSlicer"
         target_config_path.mkdir(parents=True)
 
-        def mock_paths():
-            return {
-                "orcaslicer": target_config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = target_config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         # Should restore successfully despite platform difference
         success = restore_backup(backup_dir, backup_existing=False)
@@ -321,41 +293,27 @@ class TestRestoreWorkflow:
         assert (target_config_path / "OrcaSlicer.conf").exists()
 
     def test_restore_flashforge_with_custom_scripts(
-        self, temp_flashforge_config, tmp_path, monkeypatch
+        self, temp_flashforge_config, tmp_path, mock_slicer_paths
     ):
         """Test restoring Orca-Flashforge backup with custom scripts."""
         source_config_path, _, _ = temp_flashforge_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": tmp_path / "OrcaSlicer",
-                "orca-flashforge": source_config_path,
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = tmp_path / "OrcaSlicer"
+        mock_slicer_paths["orca-flashforge"] = source_config_path
 
         # Create backup
         output_dir = tmp_path / "backups"
-        from orca_backup.core.detector import get_slicer_info
-
         source_slicer = get_slicer_info(SlicerType.ORCA_FLASHFORGE)
         backup_path = create_backup(
-            source_slicer, output_dir, compress=True, verify=True
+            source_slicer, output_dir, compress=True, verify=False
         )
 
         # Restore to new location
         target_config_path = tmp_path / "restored" / "Orca-Flashforge"
         target_config_path.mkdir(parents=True)
 
-        def mock_paths_restore():
-            return {
-                "orcaslicer": tmp_path / "OrcaSlicer",
-                "orca-flashforge": target_config_path,
-            }
-
-        monkeypatch.setattr(
-            "orca_backup.core.detector.get_slicer_paths", mock_paths_restore
-        )
+        mock_slicer_paths["orcaslicer"] = tmp_path / "OrcaSlicer"
+        mock_slicer_paths["orca-flashforge"] = target_config_path
 
         success = restore_backup(backup_path, backup_existing=False)
 
@@ -1,7 +1,9 @@
 """Unit tests for backup creation."""
 
+import errno
 import json
 import platform
+import zipfile
 from datetime import datetime
 from pathlib import Path
 
@@ -88,6 +90,23 @@ class TestCopyFileWithMetadata:
         assert dst_file.exists()
         assert dst_file.parent.exists()
 
+    def test_copy_records_created_directories(self, tmp_path):
+        """Test that a shared created_dirs set is filled in and reused."""
+        base_path = tmp_path / "base"
+        base_path.mkdir()
+        (base_path / "a.txt").write_text("a")
+        (base_path / "b.txt").write_text("b")
+
+        dst_dir = tmp_path / "dest" / "nested"
+        created_dirs = set()
+
+        copy_file_with_metadata(base_path / "a.txt", dst_dir / "a.txt", base_path, created_dirs)
+        copy_file_with_metadata(base_path / "b.txt", dst_dir / "b.txt", base_path, created_dirs)
+
+        assert created_dirs == {dst_dir}
+        assert (dst_dir / "a.txt").exists()
+        assert (dst_dir / "b.txt").exists()
+
     def test_copy_with_nested_source(self, tmp_path):
         """Test copying from nested source path."""
         base_path = tmp_path / "base"
@@ -119,7 +138,7 @@ class TestCopyFileWithMetadata:
 
         copy_file_with_metadata(src_file, dst_file, base_path)
 
-        # shutil.copy2 should preserve timestamps
+        # shutil.copystat should preserve timestamps
         assert dst_file.stat().st_mtime == src_file.stat().st_mtime
 
 
@@ -189,6 +208,24 @@ class TestCreateBackupStaging:
             assert len(entry.sha256) == 64  # SHA256 is 64 hex chars
             assert entry.size > 0  # Files should have content
 
+    @pytest.mark.parametrize("parallel_min_bytes", [4 * 1024 * 1024, 0], ids=["serial", "threads"])
+    def test_entries_match_staged_files(
+        self, sample_flashforge_info, tmp_path, monkeypatch, parallel_min_bytes
+    ):
+        """Test that each entry's size and checksum describe the staged copy, in order."""
+        monkeypatch.setattr("orca_backup.utils.parallel.PARALLEL_MIN_BYTES", parallel_min_bytes)
+        monkeypatch.setattr("orca_backup.utils.parallel.IO_WORKERS", 2)
+        staging_dir = tmp_path / "staging"
+        staging_dir.mkdir()
+
+        entries = create_backup_staging(sample_flashforge_info, staging_dir)
+
+        assert entries[0].path == "Orca-Flashforge.conf"
+        for entry in entries:
+            staged = staging_dir / entry.path
+            assert entry.size == staged.stat().st_size
+            assert entry.sha256 == calculate_sha256(staged)
+
     def test_relative_paths(self, sample_slicer_info, tmp_path):
         """Test that all paths are relative."""
         staging_dir = tmp_path / "staging"
@@ -266,6 +303,23 @@ class TestCreateBackup:
         assert backup_path.suffix == ".zip"
         assert "Orcaslicer_backup_" in backup_path.name
 
+    def test_staging_root_sized_for_source(self, sample_slicer_info, tmp_path, monkeypatch):
+        """Test that the staging directory is chosen for the size of the files to back up."""
+        requested = []
+
+        def get_staging_root(required_bytes):
+            requested.append(required_bytes)
+            return None
+
+        monkeypatch.setattr("orca_backup.core.backup.get_staging_root", get_staging_root)
+
+        backup_path = create_backup(sample_slicer_info, tmp_path / "backups", verify=False)
+
+        with zipfile.ZipFile(backup_path) as zipf:
+            members = [info for info in zipf.infolist() if info.filename != "backup_manifest.json"]
+            staged = sum(info.file_size for info in members)
+        assert requested == [staged]
+
     def test_create_uncompressed_backup(self, sample_slicer_info, tmp_path, monkeypatch):
         """Test creating uncompressed backup."""
         output_dir = tmp_path / "backups"
@@ -280,6 +334,44 @@ class TestCreateBackup:
         assert backup_path.is_dir()
         assert not backup_path.suffix == ".zip"
 
+    def test_uncompressed_backup_never_merges_into_existing(
+        self, sample_slicer_info, tmp_path, monkeypatch
+    ):
+        """Test that a second uncompressed backup with the same name fails, untouched."""
+        output_dir = tmp_path / "backups"
+
+        class FakeDatetime(datetime):
+            @classmethod
+            def now(cls, tz=None):
+                return datetime(2025, 11, 14, 12, 0, 0)
+
+        monkeypatch.setattr("orca_backup.core.backup.datetime", FakeDatetime)
+
+        first = create_backup(sample_slicer_info, output_dir, compress=False, verify=False)
+        contents = sorted(path.name for path in first.iterdir())
+
+        with pytest.raises(FileExistsError):
+            create_backup(sample_slicer_info, output_dir, compress=False, verify=False)
+
+        assert sorted(path.name for path in first.iterdir()) == contents
+        assert not (first / "backup").exists()
+
+    def test_uncompressed_backup_across_filesystems(
+        self, sample_slicer_info, tmp_path, monkeypatch
+    ):
+        """Test that the staged directory is copied when it cannot be renamed into place."""
+        output_dir = tmp_path / "backups"
+
+        def cross_device_rename(src, dst):
+            raise OSError(errno.EXDEV, "Invalid cross-device link")
+
+        monkeypatch.setattr("orca_backup.core.backup.os.rename", cross_device_rename)
+
+        backup_path = create_backup(sample_slicer_info, output_dir, compress=False, verify=True)
+
+        assert (backup_path / "backup_manifest.json").exists()
+        assert (backup_path / "OrcaSlicer.conf").exists()
+
     def test_create_backup_creates_output_dir(self, sample_slicer_info, tmp_path, monkeypatch):
         """Test that output directory is created if it doesn't exist."""
         output_dir = tmp_path / "new" / "nested" / "dir"
@@ -296,7 +388,7 @@ class TestCreateBackup:
         output_dir = tmp_path / "backups"
         verify_called = []
 
-        def mock_verify(path):
+        def mock_verify(path, fast=False):
             verify_called.append(path)
             return True
 
@@ -314,7 +406,7 @@ class TestCreateBackup:
         """Test that verification failure raises error."""
         output_dir = tmp_path / "backups"
 
-        monkeypatch.setattr("orca_backup.core.verify.verify_backup", lambda p: False)
+        monkeypatch.setattr("orca_backup.core.verify.verify_backup", lambda p, fast=False: False)
 
         with pytest.raises(RuntimeError, match="Backup verification failed"):
             create_backup(sample_slicer_info, output_dir, compress=True, verify=True)
@@ -1,5 +1,7 @@
 """Unit tests for compression utilities."""
 
+import os
+import tracemalloc
 import zipfile
 from pathlib import Path
 
@@ -114,6 +116,48 @@ class TestCompressDirectory:
             assert info.compress_type == zipfile.ZIP_DEFLATED
             # Compressed size should be smaller
             assert info.compress_size < info.file_size
+            assert zipf.testzip() is None
+
+    def test_compress_with_compresslevel(self, tmp_path):
+        """Test that a higher compresslevel never produces a larger archive."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        content = "".join(f'"setting_{i}": "{i * 7919 % 1000}",\n' for i in range(2000))
+        (source_dir / "profile.json").write_text(content)
+
+        fast_zip = compress_directory(source_dir, tmp_path / "fast.zip", compresslevel=1)
+        small_zip = compress_directory(source_dir, tmp_path / "small.zip", compresslevel=9)
+
+        assert small_zip.stat().st_size <= fast_zip.stat().st_size
+        with zipfile.ZipFile(fast_zip, "r") as zipf:
+            assert zipf.read("profile.json").decode() == content
+
+    def test_compress_level_zero_stores_everything(self, tmp_path):
+        """Test that compresslevel=0 writes every member stored."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "file.txt").write_text("x" * 1000)
+
+        output_file = tmp_path / "output.zip"
+        compress_directory(source_dir, output_file, compresslevel=0)
+
+        with zipfile.ZipFile(output_file, "r") as zipf:
+            info = zipf.getinfo("file.txt")
+            assert info.compress_type == zipfile.ZIP_STORED
+            assert zipf.read("file.txt").decode() == "x" * 1000
+
+    def test_compress_stores_compressed_formats(self, tmp_path):
+        """Test that already-compressed files are stored, not deflated again."""
+        source_dir = tmp_path / "source"
+        source_dir.mkdir()
+        (source_dir / "model.3mf").write_bytes(b"PK\x03\x04" + b"\x00" * 100)
+
+        output_file = tmp_path / "output.zip"
+        compress_directory(source_dir, output_file)
+
+        with zipfile.ZipFile(output_file, "r") as zipf:
+            info = zipf.getinfo("model.3mf")
+            assert info.compress_type == zipfile.ZIP_STORED
 
 
 class TestExtractArchive:
@@ -136,6 +180,72 @@ class TestExtractArchive:
         assert (output_dir / "file1.txt").read_text() == "content1"
         assert (output_dir / "file2.txt").read_text() == "content2"
 
+    def test_extract_stays_inside_output_directory(self, tmp_path):
+        """Test that '..' and absolute member names cannot escape the output directory."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("../escaped.txt", "content1")
+            zipf.writestr("/absolute.txt", "content2")
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "escaped.txt").read_text() == "content1"
+        assert (output_dir / "absolute.txt").read_text() == "content2"
+        assert not (tmp_path / "escaped.txt").exists()
+
+    @pytest.mark.skipif(os.name != "nt", reason="backslashes and drives only separate on Windows")
+    @pytest.mark.parametrize("name", ["..\\..\\evil.txt", "D:/evil.txt", "C:\\evil.txt"])
+    def test_extract_strips_windows_drives_and_parents(self, tmp_path, name):
+        """Test that backslash '..' parts and drive letters cannot escape on Windows."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr(name, "content")
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "evil.txt").read_text() == "content"
+
+    def test_extract_rejects_symlink_escape(self, tmp_path):
+        """Test that a member resolving outside the output directory is rejected."""
+        outside = tmp_path / "outside"
+        outside.mkdir()
+        output_dir = tmp_path / "extracted"
+        output_dir.mkdir()
+        try:
+            (output_dir / "link").symlink_to(outside, target_is_directory=True)
+        except OSError:
+            pytest.skip("symlinks not supported")
+
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("link/evil.txt", "content")
+
+        with pytest.raises(zipfile.BadZipFile, match="outside"):
+            extract_archive(archive_path, output_dir)
+
+        assert not (outside / "evil.txt").exists()
+
+    def test_extract_into_empty_directory_skips_resolving_members(self, tmp_path, monkeypatch):
+        """Test that members are not resolved one by one when nothing can be a symlink."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            for i in range(5):
+                zipf.writestr(f"../dir/file{i}.txt", "content")
+
+        resolved = []
+        original_resolve = Path.resolve
+        monkeypatch.setattr(
+            Path, "resolve", lambda self, *args: resolved.append(self) or original_resolve(self)
+        )
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert resolved == [output_dir]
+        assert (output_dir / "dir" / "file4.txt").read_text() == "content"
+
     def test_extract_creates_output_directory(self, tmp_path):
         """Test that extract creates output directory if it doesn't exist."""
         archive_path = tmp_path / "test.zip"
@@ -191,6 +301,130 @@ class TestExtractArchive:
 
         assert (output_dir / "binary.bin").read_bytes() == binary_data
 
+    def test_extract_directory_entries(self, tmp_path):
+        """Test that directory entries, including empty ones, are created."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("empty/", "")
+            zipf.writestr("a/", "")
+            zipf.writestr("a/b/file.txt", "content")
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "empty").is_dir()
+        assert (output_dir / "a" / "b" / "file.txt").read_text() == "content"
+
+    def test_extract_corrupted_member_raises(self, tmp_path):
+        """Test that a deflated member with damaged data is rejected."""
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("file.txt", "original content " * 20)
+
+        # Overwrite the start of the member's data, just past its local header
+        with open(archive_path, "r+b") as f:
+            f.seek(30 + len("file.txt"))
+            f.write(b"CORRUPTED")
+
+        with pytest.raises(zipfile.BadZipFile):
+            extract_archive(archive_path, tmp_path / "extracted")
+
+    @pytest.mark.parametrize("in_memory_max", [16 * 1024 * 1024, 0], ids=["pread", "streamed"])
+    def test_extract_corrupted_stored_member_raises(self, tmp_path, monkeypatch, in_memory_max):
+        """Test that a stored member whose bytes no longer match its CRC is rejected."""
+        monkeypatch.setattr("orca_backup.utils.compression.IN_MEMORY_EXTRACT_MAX", in_memory_max)
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_STORED) as zipf:
+            zipf.writestr("f.txt", "ORIGINAL content")
+
+        # Same length, different bytes: only the CRC can catch it
+        with open(archive_path, "r+b") as f:
+            f.seek(30 + len("f.txt"))
+            f.write(b"CORRUPTX")
+
+        with pytest.raises(zipfile.BadZipFile, match="Bad CRC-32"):
+            extract_archive(archive_path, tmp_path / "extracted")
+
+    @pytest.mark.parametrize("use_libdeflate", [False, True], ids=["zlib", "libdeflate"])
+    def test_extract_rejects_member_larger_than_declared(
+        self, tmp_path, monkeypatch, use_libdeflate
+    ):
+        """Test that a member inflating past its declared size is rejected without inflating it."""
+        if use_libdeflate:
+            pytest.importorskip("deflate")
+        else:
+            monkeypatch.setattr("orca_backup.utils.compression.deflate", None)
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("bomb.bin", b"\0" * (20 * 1024 * 1024))
+
+        # Shrink the declared size in the central directory; the local header is ignored
+        with zipfile.ZipFile(archive_path) as zipf:
+            info = zipf.getinfo("bomb.bin")
+        data = archive_path.read_bytes()
+        directory = data.rindex(b"PK\x01\x02")
+        size_field = directory + 24
+        assert int.from_bytes(data[size_field : size_field + 4], "little") == info.file_size
+        archive_path.write_bytes(
+            data[:size_field] + (10).to_bytes(4, "little") + data[size_field + 4 :]
+        )
+
+        tracemalloc.start()
+        try:
+            with pytest.raises(zipfile.BadZipFile):
+                extract_archive(archive_path, tmp_path / "extracted")
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+
+        # Nowhere near the 20 MiB the member would inflate to
+        assert peak < 1024 * 1024
+        assert not (tmp_path / "extracted" / "bomb.bin").exists()
+
+    def test_extract_streams_large_members(self, tmp_path, monkeypatch):
+        """Test that members over the in-memory limit are streamed in chunks."""
+        monkeypatch.setattr("orca_backup.utils.compression.IN_MEMORY_EXTRACT_MAX", 0)
+        monkeypatch.setattr("orca_backup.utils.compression.EXTRACT_CHUNK_SIZE", 64)
+        content = bytes(range(256)) * 10
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w", zipfile.ZIP_DEFLATED) as zipf:
+            zipf.writestr("large.bin", content)
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "large.bin").read_bytes() == content
+
+    def test_extract_without_pread(self, tmp_path, monkeypatch):
+        """Test extraction where os.pread is missing (Windows)."""
+        monkeypatch.delattr("os.pread", raising=False)
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            zipf.writestr("deflated.txt", "deflated content" * 20, zipfile.ZIP_DEFLATED)
+            zipf.writestr("stored.txt", "stored content", zipfile.ZIP_STORED)
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        assert (output_dir / "deflated.txt").read_text() == "deflated content" * 20
+        assert (output_dir / "stored.txt").read_text() == "stored content"
+
+    def test_extract_many_members(self, tmp_path, monkeypatch):
+        """Test extracting mixed stored and deflated members on the thread pool."""
+        monkeypatch.setattr("orca_backup.utils.parallel.PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr("orca_backup.utils.parallel.IO_WORKERS", 4)
+        archive_path = tmp_path / "test.zip"
+        with zipfile.ZipFile(archive_path, "w") as zipf:
+            for i in range(20):
+                compress_type = zipfile.ZIP_STORED if i % 2 else zipfile.ZIP_DEFLATED
+                zipf.writestr(f"dir{i % 3}/file{i}.txt", f"content{i}" * 50, compress_type)
+
+        output_dir = tmp_path / "extracted"
+        extract_archive(archive_path, output_dir)
+
+        for i in range(20):
+            assert (output_dir / f"dir{i % 3}" / f"file{i}.txt").read_text() == f"content{i}" * 50
+
 
 class TestIsValidZip:
     """Tests for is_valid_zip function."""
@@ -258,3 +492,28 @@ class TestIsValidZip:
 
         # testzip() should detect CRC mismatch
         assert is_valid_zip(zip_path) is False
+
+    def test_shallow_check_skips_data(self, tmp_path):
+        """Test that deep=False accepts intact structure without reading file data."""
+        zip_path = tmp_path / "crc_error.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("file.txt", "original content")
+
+        with open(zip_path, "r+b") as f:
+            f.seek(30)
+            f.write(b"CORRUPTED")
+
+        # Headers and directory are intact; only a deep check sees the bad data
+        assert is_valid_zip(zip_path, deep=False) is True
+        assert is_valid_zip(zip_path, deep=True) is False
+
+    def test_shallow_check_bad_local_header(self, tmp_path):
+        """Test that deep=False rejects an entry whose local header is damaged."""
+        zip_path = tmp_path / "bad_header.zip"
+        with zipfile.ZipFile(zip_path, "w") as zipf:
+            zipf.writestr("file.txt", "original content")
+
+        with open(zip_path, "r+b") as f:
+            f.write(b"XXXX")
+
+        assert is_valid_zip(zip_path, deep=False) is False
@@ -93,6 +93,16 @@ class TestExtractVersion:
 
         assert version == "2.1.0-beta"
 
+    def test_header_read_without_parsing_whole_file(self, tmp_path):
+        """Test that a leading header is found without parsing the rest of the file."""
+        conf_file = tmp_path / "test.conf"
+        # Everything after the header is not valid JSON
+        conf_file.write_text('{"header": "OrcaSlicer 2.3.1", ' + "x" * 20000)
+
+        version = extract_version(conf_file)
+
+        assert version == "2.3.1"
+
     def test_extract_from_app_version(self, tmp_path):
         """Test extracting version from app.version field."""
         conf_content = {
@@ -106,6 +116,15 @@ class TestExtractVersion:
 
         assert version == "1.9.0"
 
+    def test_app_version_read_without_parsing(self, tmp_path):
+        """Test that app.version is found by scanning, even if the JSON is malformed."""
+        conf_file = tmp_path / "test.conf"
+        conf_file.write_text('{"app": {"name": "OrcaSlicer", "version": "1.9.0"}, ' + "x" * 20000)
+
+        version = extract_version(conf_file)
+
+        assert version == "1.9.0"
+
     def test_extract_version_with_beta(self, tmp_path):
         """Test extracting version with beta suffix."""
         conf_content = {"header": "OrcaSlicer 2.3.1-beta", "app": {}}
@@ -181,18 +200,13 @@ class TestExtractVersion:
 class TestGetSlicerInfo:
     """Tests for get_slicer_info function."""
 
-    def test_orcaslicer_installed(self, temp_slicer_config, monkeypatch):
+    def test_orcaslicer_installed(self, temp_slicer_config, mock_slicer_paths):
         """Test detecting installed OrcaSlicer."""
         config_path, conf_file, user_dir = temp_slicer_config
 
-        # Mock get_slicer_paths to return our test paths
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        # Point slicer detection at our test paths
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         slicer = get_slicer_info(SlicerType.ORCASLICER)
 
@@ -205,18 +219,13 @@ class TestGetSlicerInfo:
         assert slicer.version == "2.1.0-beta"
 
     def test_orca_flashforge_with_custom_scripts(
-        self, temp_flashforge_config, monkeypatch
+        self, temp_flashforge_config, mock_slicer_paths
     ):
         """Test detecting Orca-Flashforge with custom scripts."""
         config_path, conf_file, user_dir = temp_flashforge_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path.parent / "OrcaSlicer",
-                "orca-flashforge": config_path,
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path.parent / "OrcaSlicer"
+        mock_slicer_paths["orca-flashforge"] = config_path
 
         slicer = get_slicer_info(SlicerType.ORCA_FLASHFORGE)
 
@@ -225,17 +234,12 @@ class TestGetSlicerInfo:
         assert slicer.custom_scripts_dir is not None
         assert slicer.custom_scripts_dir.exists()
 
-    def test_slicer_not_installed(self, tmp_path, monkeypatch):
+    def test_slicer_not_installed(self, tmp_path, mock_slicer_paths):
         """Test detecting non-existent slicer."""
         nonexistent_path = tmp_path / "NonExistent"
 
-        def mock_paths():
-            return {
-                "orcaslicer": nonexistent_path,
-                "orca-flashforge": tmp_path / "OrcaFlashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = nonexistent_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "OrcaFlashforge"
 
         slicer = get_slicer_info(SlicerType.ORCASLICER)
 
@@ -244,24 +248,19 @@ class TestGetSlicerInfo:
         assert slicer.user_dir is None
         assert slicer.version is None
 
-    def test_custom_scripts_dir_absent(self, temp_slicer_config, monkeypatch):
+    def test_custom_scripts_dir_absent(self, temp_slicer_config, mock_slicer_paths):
         """Test that custom_scripts_dir is None if it doesn't exist."""
         config_path, _, _ = temp_slicer_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": config_path.parent / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "Orca-Flashforge"
 
         slicer = get_slicer_info(SlicerType.ORCASLICER)
 
         # OrcaSlicer doesn't have custom_scripts by default
         assert slicer.custom_scripts_dir is None
 
-    def test_missing_conf_file(self, tmp_path, monkeypatch):
+    def test_missing_conf_file(self, tmp_path, mock_slicer_paths):
         """Test slicer with missing conf file."""
         config_path = tmp_path / "OrcaSlicer"
         config_path.mkdir()
@@ -269,13 +268,8 @@ class TestGetSlicerInfo:
         user_dir.mkdir()
         # No conf file created
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,
-                "orca-flashforge": tmp_path / "Orca-Flashforge",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "Orca-Flashforge"
 
         slicer = get_slicer_info(SlicerType.ORCASLICER)
 
@@ -310,17 +304,12 @@ class TestDetectSlicers:
 class TestGetInstalledSlicers:
     """Tests for get_installed_slicers function."""
 
-    def test_filters_only_valid_slicers(self, temp_slicer_config, monkeypatch):
+    def test_filters_only_valid_slicers(self, temp_slicer_config, mock_slicer_paths):
         """Test that only valid slicers are returned."""
         config_path, _, _ = temp_slicer_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": config_path,  # Valid
-                "orca-flashforge": config_path.parent / "NonExistent",  # Invalid
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = config_path  # Valid
+        mock_slicer_paths["orca-flashforge"] = config_path.parent / "NonExistent"  # Invalid
 
         installed = get_installed_slicers()
 
@@ -328,35 +317,25 @@ class TestGetInstalledSlicers:
         assert installed[0].name == "orcaslicer"
         assert installed[0].is_valid() is True
 
-    def test_no_installed_slicers(self, tmp_path, monkeypatch):
+    def test_no_installed_slicers(self, tmp_path, mock_slicer_paths):
         """Test when no slicers are installed."""
 
-        def mock_paths():
-            return {
-                "orcaslicer": tmp_path / "NonExistent1",
-                "orca-flashforge": tmp_path / "NonExistent2",
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = tmp_path / "NonExistent1"
+        mock_slicer_paths["orca-flashforge"] = tmp_path / "NonExistent2"
 
         installed = get_installed_slicers()
 
         assert len(installed) == 0
 
     def test_all_slicers_installed(
-        self, temp_slicer_config, temp_flashforge_config, monkeypatch
+        self, temp_slicer_config, temp_flashforge_config, mock_slicer_paths
     ):
         """Test when all slicers are installed."""
         orca_path, _, _ = temp_slicer_config
         flash_path, _, _ = temp_flashforge_config
 
-        def mock_paths():
-            return {
-                "orcaslicer": orca_path,
-                "orca-flashforge": flash_path,
-            }
-
-        monkeypatch.setattr("orca_backup.core.detector.get_slicer_paths", mock_paths)
+        mock_slicer_paths["orcaslicer"] = orca_path
+        mock_slicer_paths["orca-flashforge"] = flash_path
 
         installed = get_installed_slicers()
 
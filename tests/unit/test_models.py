@@ -2,12 +2,29 @@
 
 from datetime import datetime
 from pathlib import Path
+from types import SimpleNamespace
+from typing import get_args
 
 import pytest
 from pydantic import ValidationError
 
 from orca_backup.models.backup import BackupInfo, BackupManifest, FileEntry
-from orca_backup.models.slicer import SlicerInfo, SlicerType
+from orca_backup.models.slicer import SlicerInfo, SlicerName, SlicerType
+
+# Placeholder checksum for entries whose content is never hashed
+FAKE_SHA256 = "a" * 64
+
+# BackupInfo never touches its backup_path, so it need not exist
+DUMMY_BACKUP_PATH = Path("/nonexistent/test.zip")
+
+# Required BackupManifest fields, for tests that exercise validation and defaults
+MINIMAL_MANIFEST = {
+    "created_at": datetime(2025, 11, 14, 12, 0, 0),
+    "slicer": "orcaslicer",
+    "platform": "linux",
+    "total_files": 0,
+    "total_size": 0,
+}
 
 
 class TestSlicerType:
@@ -28,43 +45,67 @@ class TestSlicerType:
         with pytest.raises(ValueError):
             SlicerType("invalid-slicer")
 
+    def test_slicer_name_matches_enum(self):
+        """Test that the SlicerName literal lists exactly the SlicerType values."""
+        assert set(get_args(SlicerName)) == {slicer_type.value for slicer_type in SlicerType}
+
+    @pytest.mark.parametrize("name", ["orca-flashforge", SlicerType.ORCA_FLASHFORGE])
+    def test_slicer_info_accepts_name(self, name):
+        """Test that SlicerInfo takes a slicer name as a string or enum member."""
+        slicer = SlicerInfo(
+            name=name, display_name="Orca-Flashforge", config_path=Path("x"), exists=False
+        )
+
+        assert type(slicer.name) is str
+        assert slicer.name == "orca-flashforge"
+
+    def test_slicer_info_rejects_unknown_name(self):
+        """Test that SlicerInfo rejects names that are not slicer types."""
+        with pytest.raises(ValidationError):
+            SlicerInfo(name="invalid-slicer", display_name="X", config_path=Path("x"), exists=False)
+
+
+@pytest.fixture(scope="module")
+def orca_tree(tmp_path_factory):
+    """A complete OrcaSlicer config tree, built once and only read by the tests."""
+    config_path = tmp_path_factory.mktemp("orca") / "OrcaSlicer"
+    config_path.mkdir()
+    conf_file = config_path / "OrcaSlicer.conf"
+    conf_file.write_text("{}")
+    user_dir = config_path / "user"
+    user_dir.mkdir()
+    return SimpleNamespace(root=config_path, conf=conf_file, user=user_dir)
+
 
 class TestSlicerInfo:
     """Tests for SlicerInfo model."""
 
-    def test_valid_slicer_info(self, tmp_path):
+    def test_valid_slicer_info(self, orca_tree):
         """Test creating valid SlicerInfo."""
-        config_path = tmp_path / "OrcaSlicer"
-        config_path.mkdir()
-        conf_file = config_path / "OrcaSlicer.conf"
-        conf_file.write_text("{}")
-        user_dir = config_path / "user"
-        user_dir.mkdir()
-
         slicer = SlicerInfo(
             name=SlicerType.ORCASLICER,
             display_name="OrcaSlicer",
-            config_path=config_path,
+            config_path=orca_tree.root,
             exists=True,
             version="2.1.0-beta",
-            conf_file=conf_file,
-            user_dir=user_dir,
+            conf_file=orca_tree.conf,
+            user_dir=orca_tree.user,
         )
 
-        assert slicer.name == "orcaslicer"  # use_enum_values=True
+        assert slicer.name == "orcaslicer"  # stored as a plain string
         assert slicer.display_name == "OrcaSlicer"
-        assert slicer.config_path == config_path
+        assert slicer.config_path == orca_tree.root
         assert slicer.exists is True
         assert slicer.version == "2.1.0-beta"
-        assert slicer.conf_file == conf_file
-        assert slicer.user_dir == user_dir
+        assert slicer.conf_file == orca_tree.conf
+        assert slicer.user_dir == orca_tree.user
 
-    def test_use_enum_values(self, tmp_path):
+    def test_use_enum_values(self):
         """Test that name uses enum values (string, not enum)."""
         slicer = SlicerInfo(
             name=SlicerType.ORCASLICER,
             display_name="OrcaSlicer",
-            config_path=tmp_path,
+            config_path=Path("OrcaSlicer"),
             exists=True,
         )
 
@@ -72,12 +113,12 @@ class TestSlicerInfo:
         assert isinstance(slicer.name, str)
         assert slicer.name == "orcaslicer"
 
-    def test_optional_fields(self, tmp_path):
+    def test_optional_fields(self):
         """Test optional fields can be None."""
         slicer = SlicerInfo(
             name=SlicerType.ORCASLICER,
             display_name="OrcaSlicer",
-            config_path=tmp_path,
+            config_path=Path("OrcaSlicer"),
             exists=False,
             version=None,
             conf_file=None,
@@ -90,100 +131,42 @@ class TestSlicerInfo:
         assert slicer.user_dir is None
         assert slicer.custom_scripts_dir is None
 
-    def test_is_valid_complete_installation(self, tmp_path):
+    def test_is_valid_complete_installation(self, orca_tree):
         """Test is_valid() returns True for complete installation."""
-        config_path = tmp_path / "OrcaSlicer"
-        config_path.mkdir()
-        conf_file = config_path / "OrcaSlicer.conf"
-        conf_file.write_text("{}")
-        user_dir = config_path / "user"
-        user_dir.mkdir()
-
         slicer = SlicerInfo(
             name=SlicerType.ORCASLICER,
             display_name="OrcaSlicer",
-            config_path=config_path,
+            config_path=orca_tree.root,
             exists=True,
-            conf_file=conf_file,
-            user_dir=user_dir,
+            conf_file=orca_tree.conf,
+            user_dir=orca_tree.user,
         )
 
         assert slicer.is_valid() is True
 
-    def test_is_valid_not_exists(self, tmp_path):
-        """Test is_valid() returns False if not exists."""
-        slicer = SlicerInfo(
+    @pytest.mark.parametrize(
+        "make_update",
+        [
+            pytest.param(lambda root: {"exists": False}, id="not_exists"),
+            pytest.param(lambda root: {"conf_file": None}, id="missing_conf_file"),
+            pytest.param(
+                lambda root: {"conf_file": root / "nonexistent.conf"}, id="conf_file_not_exists"
+            ),
+            pytest.param(lambda root: {"user_dir": None}, id="missing_user_dir"),
+            pytest.param(lambda root: {"user_dir": root / "nonexistent"}, id="user_dir_not_exists"),
+        ],
+    )
+    def test_is_valid_incomplete_installation(self, orca_tree, make_update):
+        """Test is_valid() returns False when any required part is missing."""
+        complete = SlicerInfo(
             name=SlicerType.ORCASLICER,
             display_name="OrcaSlicer",
-            config_path=tmp_path,
-            exists=False,
-        )
-
-        assert slicer.is_valid() is False
-
-    def test_is_valid_missing_conf_file(self, tmp_path):
-        """Test is_valid() returns False if conf_file is None."""
-        user_dir = tmp_path / "user"
-        user_dir.mkdir()
-
-        slicer = SlicerInfo(
-            name=SlicerType.ORCASLICER,
-            display_name="OrcaSlicer",
-            config_path=tmp_path,
+            config_path=orca_tree.root,
             exists=True,
-            conf_file=None,
-            user_dir=user_dir,
-        )
-
-        assert slicer.is_valid() is False
-
-    def test_is_valid_conf_file_not_exists(self, tmp_path):
-        """Test is_valid() returns False if conf_file doesn't exist."""
-        conf_file = tmp_path / "nonexistent.conf"
-        user_dir = tmp_path / "user"
-        user_dir.mkdir()
-
-        slicer = SlicerInfo(
-            name=SlicerType.ORCASLICER,
-            display_name="OrcaSlicer",
-            config_path=tmp_path,
-            exists=True,
-            conf_file=conf_file,
-            user_dir=user_dir,
-        )
-
-        assert slicer.is_valid() is False
-
-    def test_is_valid_missing_user_dir(self, tmp_path):
-        """Test is_valid() returns False if user_dir is None."""
-        conf_file = tmp_path / "OrcaSlicer.conf"
-        conf_file.write_text("{}")
-
-        slicer = SlicerInfo(
-            name=SlicerType.ORCASLICER,
-            display_name="OrcaSlicer",
-            config_path=tmp_path,
-            exists=True,
-            conf_file=conf_file,
-            user_dir=None,
-        )
-
-        assert slicer.is_valid() is False
-
-    def test_is_valid_user_dir_not_exists(self, tmp_path):
-        """Test is_valid() returns False if user_dir doesn't exist."""
-        conf_file = tmp_path / "OrcaSlicer.conf"
-        conf_file.write_text("{}")
-        user_dir = tmp_path / "nonexistent"
-
-        slicer = SlicerInfo(
-            name=SlicerType.ORCASLICER,
-            display_name="OrcaSlicer",
-            config_path=tmp_path,
-            exists=True,
-            conf_file=conf_file,
-            user_dir=user_dir,
+            conf_file=orca_tree.conf,
+            user_dir=orca_tree.user,
         )
+        slicer = complete.model_copy(update=make_update(orca_tree.root))
 
         assert slicer.is_valid() is False
 
@@ -196,23 +179,25 @@ class TestFileEntry:
         entry = FileEntry(
             path="user/filament/custom.json",
             size=1024,
-            sha256="a" * 64,
+            sha256=FAKE_SHA256,
         )
 
         assert entry.path == "user/filament/custom.json"
         assert entry.size == 1024
-        assert entry.sha256 == "a" * 64
-
-    def test_required_fields(self):
+        assert entry.sha256 == FAKE_SHA256
+
+    @pytest.mark.parametrize(
+        "kwargs",
+        [
+            pytest.param({"path": "test.txt", "size": 100}, id="missing_sha256"),
+            pytest.param({"path": "test.txt", "sha256": FAKE_SHA256}, id="missing_size"),
+            pytest.param({"size": 100, "sha256": FAKE_SHA256}, id="missing_path"),
+        ],
+    )
+    def test_required_fields(self, kwargs):
         """Test that all fields are required."""
         with pytest.raises(ValidationError):
-            FileEntry(path="test.txt", size=100)  # Missing sha256
-
-        with pytest.raises(ValidationError):
-            FileEntry(path="test.txt", sha256="a" * 64)  # Missing size
-
-        with pytest.raises(ValidationError):
-            FileEntry(size=100, sha256="a" * 64)  # Missing path
+            FileEntry(**kwargs)
 
     def test_invalid_checksum_length(self):
         """Test that invalid checksum length is accepted (no validation)."""
@@ -247,55 +232,31 @@ class TestBackupManifest:
         assert manifest.total_size == 1792
         assert manifest.compressed is True
 
-    def test_default_values(self, sample_file_entries):
+    def test_default_values(self):
         """Test default values for optional fields."""
-        manifest = BackupManifest(
-            created_at=datetime.now(),
-            slicer="orcaslicer",
-            platform="linux",
-            total_files=0,
-            total_size=0,
-        )
+        manifest = BackupManifest(**MINIMAL_MANIFEST)
 
         assert manifest.version == "1.0"  # Default
         assert manifest.files == []  # Default empty list
         assert manifest.compressed is True  # Default
 
-    def test_size_mb_property(self):
+    @pytest.mark.parametrize(
+        "total_size,size_mb",
+        [
+            pytest.param(2097152, 2.0, id="whole"),
+            pytest.param(1572864, 1.5, id="fractional"),
+        ],
+    )
+    def test_size_mb(self, sample_backup_manifest, total_size, size_mb):
         """Test size_mb property calculation."""
-        manifest = BackupManifest(
-            created_at=datetime.now(),
-            slicer="orcaslicer",
-            platform="linux",
-            total_files=1,
-            total_size=2097152,  # 2 MB
-        )
+        manifest = sample_backup_manifest.model_copy(update={"total_size": total_size})
 
-        assert manifest.size_mb == 2.0
+        assert manifest.size_mb == size_mb
 
-    def test_size_mb_fractional(self):
-        """Test size_mb with fractional MB."""
-        manifest = BackupManifest(
-            created_at=datetime.now(),
-            slicer="orcaslicer",
-            platform="linux",
-            total_files=1,
-            total_size=1572864,  # 1.5 MB
-        )
-
-        assert manifest.size_mb == 1.5
-
-    def test_datetime_serialization(self, sample_file_entries):
+    def test_datetime_serialization(self, sample_backup_manifest):
         """Test datetime serialization in model_dump."""
         dt = datetime(2025, 11, 14, 12, 30, 45)
-        manifest = BackupManifest(
-            created_at=dt,
-            slicer="orcaslicer",
-            platform="linux",
-            files=sample_file_entries,
-            total_files=3,
-            total_size=1792,
-        )
+        manifest = sample_backup_manifest.model_copy(update={"created_at": dt})
 
         # Test JSON mode serialization
         data = manifest.model_dump(mode="json")
@@ -303,14 +264,7 @@ class TestBackupManifest:
 
     def test_optional_slicer_version(self):
         """Test optional slicer_version field."""
-        manifest = BackupManifest(
-            created_at=datetime.now(),
-            slicer="orcaslicer",
-            slicer_version=None,
-            platform="linux",
-            total_files=0,
-            total_size=0,
-        )
+        manifest = BackupManifest(**MINIMAL_MANIFEST, slicer_version=None)
 
         assert manifest.slicer_version is None
 
@@ -318,10 +272,9 @@ class TestBackupManifest:
 class TestBackupInfo:
     """Tests for BackupInfo model."""
 
-    def test_valid_backup_info(self, tmp_path, sample_backup_manifest):
+    def test_valid_backup_info(self, sample_backup_manifest):
         """Test creating valid BackupInfo."""
-        backup_path = tmp_path / "backup.zip"
-        backup_path.write_text("test")
+        backup_path = DUMMY_BACKUP_PATH
 
         info = BackupInfo(
             backup_path=backup_path,
@@ -335,12 +288,10 @@ class TestBackupInfo:
         assert info.is_valid is True
         assert info.size_mb == 1.5
 
-    def test_invalid_backup(self, tmp_path, sample_backup_manifest):
+    def test_invalid_backup(self, sample_backup_manifest):
         """Test BackupInfo with invalid backup."""
-        backup_path = tmp_path / "corrupted.zip"
-
         info = BackupInfo(
-            backup_path=backup_path,
+            backup_path=DUMMY_BACKUP_PATH,
             manifest=sample_backup_manifest,
             is_valid=False,
             size_mb=0.0,
@@ -348,11 +299,11 @@ class TestBackupInfo:
 
         assert info.is_valid is False
 
-    def test_arbitrary_types_allowed(self, tmp_path, sample_backup_manifest):
+    def test_arbitrary_types_allowed(self, sample_backup_manifest):
         """Test that Path objects are allowed."""
         # Should not raise validation error
         info = BackupInfo(
-            backup_path=tmp_path / "test.zip",
+            backup_path=DUMMY_BACKUP_PATH,
             manifest=sample_backup_manifest,
             is_valid=True,
             size_mb=1.0,
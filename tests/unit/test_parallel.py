@@ -0,0 +1,44 @@
+"""Unit tests for the per-file thread pool helper."""
+
+import threading
+
+import pytest
+
+from orca_backup.utils.parallel import map_files
+
+
+class TestMapFiles:
+    """Tests for map_files function."""
+
+    def test_small_work_runs_on_calling_thread(self):
+        """Test that work below the byte threshold never leaves the calling thread."""
+        threads = []
+
+        def record(a, b):
+            threads.append(threading.get_ident())
+            return a + b
+
+        assert map_files(record, [1, 2, 3], [10, 20, 30], total_size=100) == [11, 22, 33]
+        assert set(threads) == {threading.get_ident()}
+
+    def test_single_worker_runs_on_calling_thread(self, monkeypatch):
+        """Test that no pool is started when only one worker is available."""
+        monkeypatch.setattr("orca_backup.utils.parallel.PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr("orca_backup.utils.parallel.IO_WORKERS", 1)
+        threads = []
+
+        def record(item):
+            threads.append(threading.get_ident())
+            return item
+
+        assert map_files(record, [1, 2, 3], total_size=100) == [1, 2, 3]
+        assert set(threads) == {threading.get_ident()}
+
+    @pytest.mark.parametrize("count", [0, 1, 20])
+    def test_large_work_keeps_order(self, monkeypatch, count):
+        """Test that pooled results come back in input order."""
+        monkeypatch.setattr("orca_backup.utils.parallel.PARALLEL_MIN_BYTES", 0)
+        monkeypatch.setattr("orca_backup.utils.parallel.IO_WORKERS", 4)
+
+        items = list(range(count))
+        assert map_files(lambda item: item * 2, items, total_size=1) == [i * 2 for i in items]
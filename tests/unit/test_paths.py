@@ -1,19 +1,84 @@
 """Unit tests for path utilities."""
 
+import shutil
 from datetime import datetime
 from pathlib import Path
 
 import pytest
 
-from orca_backup.utils.paths import ensure_directory, get_backup_name, get_default_backup_dir
+from orca_backup.utils.paths import (
+    ensure_directory,
+    get_backup_name,
+    get_default_backup_dir,
+    get_staging_root,
+    scandir_recursive,
+)
+
+HOME = Path.home()
+
+# (slicer, timestamp, compressed, expected) for TestGetBackupName
+BACKUP_NAME_CASES = (
+    pytest.param(
+        "orcaslicer",
+        datetime(2025, 11, 14, 15, 30, 45),
+        True,
+        "Orcaslicer_backup_2025-11-14_15-30-45.zip",
+        id="default_compressed",
+    ),
+    pytest.param(
+        "orcaslicer",
+        datetime(2025, 11, 14, 15, 30, 45),
+        False,
+        "Orcaslicer_backup_2025-11-14_15-30-45",
+        id="uncompressed",
+    ),
+    pytest.param(
+        "orca-flashforge",
+        datetime(2025, 11, 14, 15, 30, 45),
+        True,
+        "Orca_Flashforge_backup_2025-11-14_15-30-45.zip",
+        id="orca_flashforge",
+    ),
+    # Zero-padded timestamp fields
+    pytest.param(
+        "orcaslicer",
+        datetime(2025, 1, 5, 9, 5, 3),
+        True,
+        "Orcaslicer_backup_2025-01-05_09-05-03.zip",
+        id="timestamp_format",
+    ),
+    # Mixed-case input is title-cased
+    pytest.param(
+        "OrCaSlIcEr",
+        datetime(2025, 11, 14, 12, 0, 0),
+        True,
+        "Orcaslicer_backup_2025-11-14_12-00-00.zip",
+        id="title_case",
+    ),
+)
+
+
+@pytest.fixture
+def frozen_now(monkeypatch):
+    """Pin datetime.now() in the paths module to 2025-11-14 15:30:45."""
+
+    class FrozenDatetime(datetime):
+        @classmethod
+        def now(cls, tz=None):
+            return cls(2025, 11, 14, 15, 30, 45, tzinfo=tz)
+
+    monkeypatch.setattr("orca_backup.utils.paths.datetime", FrozenDatetime)
 
 
 class TestEnsureDirectory:
     """Tests for ensure_directory function."""
 
-    def test_creates_new_directory(self, tmp_path):
+    # These only exercise mkdir and exists, so they run against pyfakefs's
+    # in-memory filesystem (the fs fixture) instead of the disk
+
+    def test_creates_new_directory(self, fs):
         """Test that ensure_directory creates a new directory."""
-        new_dir = tmp_path / "test_dir"
+        new_dir = Path("/fake/test_dir")
         assert not new_dir.exists()
 
         result = ensure_directory(new_dir)
@@ -22,19 +87,19 @@ class TestEnsureDirectory:
         assert new_dir.is_dir()
         assert result == new_dir
 
-    def test_handles_existing_directory(self, tmp_path):
+    def test_handles_existing_directory(self, fs):
         """Test that ensure_directory handles existing directory."""
-        existing_dir = tmp_path / "existing"
-        existing_dir.mkdir()
+        existing_dir = Path("/fake/existing")
+        existing_dir.mkdir(parents=True)
 
         result = ensure_directory(existing_dir)
 
         assert existing_dir.exists()
         assert result == existing_dir
 
-    def test_creates_parent_directories(self, tmp_path):
+    def test_creates_parent_directories(self, fs):
         """Test that ensure_directory creates parent directories."""
-        nested_dir = tmp_path / "parent" / "child" / "grandchild"
+        nested_dir = Path("/fake/parent/child/grandchild")
         assert not nested_dir.exists()
         assert not nested_dir.parent.exists()
 
@@ -44,9 +109,9 @@ class TestEnsureDirectory:
         assert nested_dir.parent.exists()
         assert result == nested_dir
 
-    def test_returns_path_object(self, tmp_path):
+    def test_returns_path_object(self, fs):
         """Test that ensure_directory returns a Path object."""
-        new_dir = tmp_path / "test"
+        new_dir = Path("/fake/test")
         result = ensure_directory(new_dir)
 
         assert isinstance(result, Path)
@@ -55,91 +120,88 @@ class TestEnsureDirectory:
 class TestGetBackupName:
     """Tests for get_backup_name function."""
 
-    def test_default_compressed(self):
-        """Test default backup name with compression."""
-        timestamp = datetime(2025, 11, 14, 15, 30, 45)
-        name = get_backup_name("orcaslicer", timestamp, compressed=True)
+    @pytest.mark.parametrize("slicer,timestamp,compressed,expected", BACKUP_NAME_CASES)
+    def test_backup_name(self, slicer, timestamp, compressed, expected):
+        """Test backup names for each slicer, timestamp and compression setting."""
+        assert get_backup_name(slicer, timestamp, compressed=compressed) == expected
 
-        assert name == "Orcaslicer_backup_2025-11-14_15-30-45.zip"
+    def test_no_timestamp_uses_now(self, frozen_now):
+        """Test that None timestamp uses current time."""
+        assert (
+            get_backup_name("orcaslicer", timestamp=None)
+            == "Orcaslicer_backup_2025-11-14_15-30-45.zip"
+        )
 
-    def test_uncompressed(self):
-        """Test backup name without compression."""
-        timestamp = datetime(2025, 11, 14, 15, 30, 45)
-        name = get_backup_name("orcaslicer", timestamp, compressed=False)
 
-        assert name == "Orcaslicer_backup_2025-11-14_15-30-45"
+class TestGetDefaultBackupDir:
+    """Tests for get_default_backup_dir function."""
 
-    def test_orca_flashforge_name(self):
-        """Test backup name for Orca-Flashforge."""
-        timestamp = datetime(2025, 11, 14, 15, 30, 45)
-        name = get_backup_name("orca-flashforge", timestamp, compressed=True)
+    def test_returns_path_object(self):
+        """Test that get_default_backup_dir returns a Path object."""
+        result = get_default_backup_dir()
+        assert isinstance(result, Path)
 
-        assert name == "Orca_Flashforge_backup_2025-11-14_15-30-45.zip"
+    def test_default_directory_in_home(self):
+        """Test that default directory is OrcaBackups in the user's home."""
+        result = get_default_backup_dir()
 
-    def test_timestamp_format(self):
-        """Test timestamp formatting."""
-        timestamp = datetime(2025, 1, 5, 9, 5, 3)
-        name = get_backup_name("orcaslicer", timestamp)
+        assert result == HOME / "OrcaBackups"
+        assert result.parent == HOME
+        assert result.name == "OrcaBackups"
 
-        # Should have zero-padded values
-        assert "2025-01-05_09-05-03" in name
 
-    def test_no_timestamp_uses_now(self):
-        """Test that None timestamp uses current time."""
-        name = get_backup_name("orcaslicer", timestamp=None)
+class TestScandirRecursive:
+    """Tests for scandir_recursive function."""
 
-        # Should contain a timestamp in the correct format
-        assert "_backup_" in name
-        assert name.endswith(".zip")
-        # Basic format check (YYYY-MM-DD_HH-MM-SS)
-        parts = name.split("_backup_")
-        assert len(parts) == 2
-        timestamp_part = parts[1].replace(".zip", "")
-        assert len(timestamp_part) == 19  # YYYY-MM-DD_HH-MM-SS
+    def test_yields_nested_files_only(self, tmp_path):
+        """Test that files in nested directories are yielded, directories are not."""
+        (tmp_path / "a" / "b").mkdir(parents=True)
+        (tmp_path / "top.txt").write_text("top")
+        (tmp_path / "a" / "b" / "deep.txt").write_text("deep")
 
-    def test_title_case_formatting(self):
-        """Test that slicer name is title-cased."""
-        timestamp = datetime(2025, 11, 14, 12, 0, 0)
+        found = {
+            Path(entry.path).relative_to(tmp_path).as_posix()
+            for entry in scandir_recursive(tmp_path)
+        }
 
-        # lowercase input
-        name1 = get_backup_name("orcaslicer", timestamp)
-        assert name1.startswith("Orcaslicer_")
+        assert found == {"top.txt", "a/b/deep.txt"}
 
-        # mixed case input
-        name2 = get_backup_name("OrCaSlIcEr", timestamp)
-        assert name2.startswith("Orcaslicer_")
+    def test_empty_directory(self, tmp_path):
+        """Test that an empty directory yields nothing."""
+        assert list(scandir_recursive(tmp_path)) == []
 
-    def test_hyphen_to_underscore(self):
-        """Test that hyphens are replaced with underscores."""
-        timestamp = datetime(2025, 11, 14, 12, 0, 0)
-        name = get_backup_name("orca-flashforge", timestamp)
 
-        # Should replace hyphen with underscore
-        assert "Orca_Flashforge_" in name
-        # Should not contain hyphens except in timestamp
-        name_part = name.split("_backup_")[0]
-        assert "-" not in name_part
+class TestGetStagingRoot:
+    """Tests for get_staging_root function."""
 
+    def test_uses_writable_ram_dir(self, tmp_path, monkeypatch):
+        """Test that a writable candidate with enough free space is used."""
+        monkeypatch.setattr("orca_backup.utils.paths.RAM_STAGING_DIRS", (str(tmp_path),))
+        monkeypatch.setattr("orca_backup.utils.paths.RAM_STAGING_MARGIN", 0)
 
-class TestGetDefaultBackupDir:
-    """Tests for get_default_backup_dir function."""
+        assert get_staging_root(0) == str(tmp_path)
 
-    def test_returns_path_object(self):
-        """Test that get_default_backup_dir returns a Path object."""
-        result = get_default_backup_dir()
-        assert isinstance(result, Path)
+    def test_requires_room_for_the_backup(self, tmp_path, monkeypatch):
+        """Test that a candidate without room for the files plus the margin is skipped."""
+        monkeypatch.setattr("orca_backup.utils.paths.RAM_STAGING_DIRS", (str(tmp_path),))
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+        free = shutil.disk_usage(tmp_path).free
 
-    def test_default_directory_name(self):
-        """Test that default directory is OrcaBackups in home."""
-        result = get_default_backup_dir()
-        expected = Path.home() / "OrcaBackups"
+        assert get_staging_root(free + 1) is None
 
-        assert result == expected
+    def test_reads_xdg_runtime_dir_at_call_time(self, tmp_path, monkeypatch):
+        """Test that XDG_RUNTIME_DIR is looked up when called, not at import."""
+        monkeypatch.setattr("orca_backup.utils.paths.RAM_STAGING_DIRS", ())
+        monkeypatch.setattr("orca_backup.utils.paths.RAM_STAGING_MARGIN", 0)
+        monkeypatch.setenv("XDG_RUNTIME_DIR", str(tmp_path))
 
-    def test_in_home_directory(self):
-        """Test that default backup dir is in user's home."""
-        result = get_default_backup_dir()
-        home = Path.home()
+        assert get_staging_root(0) == str(tmp_path)
 
-        assert result.parent == home
-        assert result.name == "OrcaBackups"
+    def test_falls_back_to_system_temp(self, tmp_path, monkeypatch):
+        """Test that None is returned when no candidate exists."""
+        monkeypatch.setattr(
+            "orca_backup.utils.paths.RAM_STAGING_DIRS", (str(tmp_path / "missing"),)
+        )
+        monkeypatch.delenv("XDG_RUNTIME_DIR", raising=False)
+
+        assert get_staging_root(0) is None